@@ -24,12 +24,62 @@ Features v3.0:
 """
 import requests
 import json
-from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, List, Tuple, TYPE_CHECKING
 import os
+import sys
 import time
 import re
-from bs4 import BeautifulSoup
+import threading
+import functools
+import bisect
+import math
+import logging
+import hashlib
+import tempfile
+from collections import Counter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, wait
+from zoneinfo import ZoneInfo
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote, urlsplit
+
+# pandas (via yfinance) and bs4 are imported where they are used - most runs
+# never need them before the first download/scrape
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Optional: orjson (de)serializes faster than the stdlib and handles numpy scalars
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, default=str, indent=2 if indent else None).encode()
+
+# Optional: lxml is a much faster BeautifulSoup backend than html.parser
+try:
+    import lxml  # noqa: F401 - only probed, bs4 loads it by name
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+log = logging.getLogger(__name__)
+
+
+# Retries per function name, so repeated upstream trouble is observable
+# without raising the log level
+RETRY_STATS: Counter = Counter()
+_RETRY_STATS_LOCK = threading.Lock()
+
 
 # Retry decorator
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
@@ -43,14 +93,155 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
                 except Exception as e:
                     last_error = e
                     if attempt < max_retries - 1:
+                        with _RETRY_STATS_LOCK:
+                            RETRY_STATS[func.__name__] += 1
                         time.sleep(delay * (attempt + 1))
-                        print(f"  [Retry {attempt + 1}/{max_retries}] {func.__name__}")
-            print(f"  [Failed] {func.__name__}: {last_error}")
+                        log.debug("  [Retry %d/%d] %s", attempt + 1, max_retries, func.__name__)
+            log.warning("  [Failed] %s: %s", func.__name__, last_error)
             return None
         return wrapper
     return decorator
 
 
+# Process-wide TTL cache shared by every MarketSentimentAnalyzer instance
+_CACHE: Dict[str, Dict] = {}
+_CACHE_LOCK = threading.RLock()
+_BULK_LOCK = threading.Lock()  # One batch download at a time
+_KEY_LOCKS: Dict[str, threading.RLock] = {}  # One in-flight fetch per cache key
+_FRED_VALIDATORS: Dict[str, Tuple[str, str]] = {}  # series -> (Last-Modified, last value)
+
+# Bumped whenever a cached source is actually (re)loaded - an unchanged
+# version means every source still returns the data the last score used
+_CACHE_VERSION = 0
+
+# Per-thread stack of confidence factors recorded by in-flight cached fetches
+_confidence_recorders = threading.local()
+
+# On-disk tier for quasi-static results. Kept apart from smc_calculator's
+# DataCache files and out of git, so CI always starts from live data. Anchored
+# to this file so running from the repo root doesn't create a second tree.
+DISK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cache', 'sentiment')
+
+# Per-key freshness (seconds), sized to how often each source actually changes.
+# Keys not listed use the analyzer's cache_duration.
+CACHE_TTL = MappingProxyType({
+    'vix': 60,
+    'stock_fear_greed': 900,
+    'crypto_fear_greed': 3600,  # alternative.me publishes once a day
+    'sectors': 300,
+    'bulk_1mo': 60,  # Live batch - no older than its shortest reader (VIX)
+    'live_closes': 60,
+    'yields': 86400,  # FRED posts one observation per day
+    'ma_True': 3600,
+    'ma_False': 3600,
+})
+
+# US regular trading hours in New York time (09:30-16:00, Mon-Fri); quotes are
+# static outside them, so cached entries live up to OFF_HOURS_TTL_FACTOR times
+# longer - but not past the next open
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN_ET = (9, 30)
+MARKET_CLOSE_ET = (16, 0)
+OFF_HOURS_TTL_FACTOR = 12
+
+
+def _us_market_open(now: Optional[datetime] = None) -> bool:
+    """True during US regular trading hours (holidays are not accounted for)"""
+    now = (now or datetime.now(timezone.utc)).astimezone(MARKET_TZ)
+    if now.weekday() >= 5:
+        return False
+    return MARKET_OPEN_ET <= (now.hour, now.minute) < MARKET_CLOSE_ET
+
+
+def _seconds_to_open(now: Optional[datetime] = None) -> float:
+    """Seconds until the next regular session opens (0 while one is open)"""
+    now = (now or datetime.now(timezone.utc)).astimezone(MARKET_TZ)
+    if _us_market_open(now):
+        return 0.0
+    day = now.date()
+    if (now.hour, now.minute) >= MARKET_OPEN_ET or day.weekday() >= 5:
+        day += timedelta(days=1)
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    opens = datetime(day.year, day.month, day.day, *MARKET_OPEN_ET, tzinfo=MARKET_TZ)
+    # Compare in UTC - same-zone subtraction ignores a DST change in between
+    return (opens.astimezone(timezone.utc) - now.astimezone(timezone.utc)).total_seconds()
+
+
+# Cache decorator
+def cached(key, persist: bool = False):
+    """Memoize a fetch method in the shared TTL cache.
+
+    `key` is a cache key string, or a callable that builds one from the
+    method's arguments. Confidence factors added during the fetch are stored
+    with the result and replayed on cache hits. Results that recorded "low"
+    quality (defaults/failures) are not cached so the next call retries.
+    Concurrent callers of the same key wait for the first fetch instead of
+    repeating it (e.g. the F&G fallback asking for VIX while it is loading).
+    With `persist=True` the entry is also written to DISK_CACHE_DIR so it
+    survives process restarts within the TTL.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache_key = key(*args, **kwargs) if callable(key) else key
+            
+            with _CACHE_LOCK:
+                key_lock = _KEY_LOCKS.setdefault(cache_key, threading.RLock())
+            
+            with key_lock:
+                entry = self._get_cache_entry(cache_key)
+                if entry is None and persist:
+                    entry = self._get_disk_cache(cache_key)
+                    if entry is not None:
+                        _bump_cache_version()
+                if entry is not None:
+                    for factor in entry['confidence']:
+                        self._add_confidence(factor['source'], factor['quality'])
+                    return entry['data']
+                
+                stack = getattr(_confidence_recorders, 'stack', None)
+                if stack is None:
+                    stack = _confidence_recorders.stack = []
+                recorded = []
+                stack.append(recorded)
+                try:
+                    result = func(self, *args, **kwargs)
+                finally:
+                    stack.pop()
+                    _bump_cache_version()
+                
+                if result is not None and not any(f['quality'] == 'low' for f in recorded):
+                    self._set_cache(cache_key, result, recorded)
+                    if persist:
+                        self._set_disk_cache(cache_key, result, recorded)
+                return result
+        return wrapper
+    return decorator
+
+
+def _bump_cache_version():
+    global _CACHE_VERSION
+    with _CACHE_LOCK:
+        _CACHE_VERSION += 1
+
+
+def _with_recorders(fn):
+    """Bind fn to the caller's confidence recorders so a worker thread's
+    confidence factors still reach the caller's in-flight cached fetches"""
+    stack = list(getattr(_confidence_recorders, 'stack', None) or [])
+    
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        previous = getattr(_confidence_recorders, 'stack', None)
+        _confidence_recorders.stack = list(stack)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _confidence_recorders.stack = previous
+    return run
+
+
 # Economic Calendar - Major Events (Updated periodically)
 # These dates significantly impact market sentiment
 ECONOMIC_CALENDAR_2025 = {
@@ -85,71 +276,651 @@ ECONOMIC_CALENDAR_2025 = {
     ]
 }
 
+# Calendar parsed once and ordered by date: (date, event type, date string).
+# Same-day events keep the ECONOMIC_CALENDAR_2025 order.
+ECONOMIC_EVENTS = tuple(sorted(
+    (
+        (datetime.strptime(date_str, "%Y-%m-%d").date(), event_type, date_str)
+        for event_type, dates in ECONOMIC_CALENDAR_2025.items()
+        for date_str in dates
+    ),
+    key=lambda event: event[0]
+))
+ECONOMIC_EVENT_DATES = tuple(event[0] for event in ECONOMIC_EVENTS)
+ECONOMIC_EVENT_NAMES = MappingProxyType({
+    "fomc": "FOMC Meeting (Fed Rate Decision)",
+    "cpi": "CPI Report (Inflation)",
+    "jobs": "Jobs Report (Non-Farm Payrolls)",
+    "gdp": "GDP Report",
+    "pce": "PCE Report (Fed's Inflation Measure)"
+})
+HIGH_IMPACT_EVENTS = frozenset({"fomc", "cpi", "jobs", "pce"})
+EVENT_LOOKAHEAD_DAYS = 3
+
+# Daily-bar symbols downloaded together in one 1y batch. VIX and the sector
+# ETFs are in the short-lived LIVE_SYMBOLS batch instead.
+BULK_SYMBOLS = [
+    "SPY", "QQQ", "DIA", "IWM", "VTI", "MDY", "IJR",      # Index ETFs
+    "TLT", "HYG",                                          # Bonds
+    "^TNX", "^FVX", "^IRX",                                # Treasury yields
+    "DX-Y.NYB", "GC=F"                                     # Dollar, Gold
+]
+
+# Scraper patterns, compiled once
+ADVANCES_RE = re.compile(r'advanc\w*[:\s]+(\d[\d,]*)', re.I)
+DECLINES_RE = re.compile(r'declin\w*[:\s]+(\d[\d,]*)', re.I)
+PCR_VALUE_RE = re.compile(r'(\d\.\d{2})')
+EQUITY_PCR_RE = re.compile(r'equity[^<]{0,200}?(\d\.\d{2})', re.I)
+
+# Approximate number of daily bars in each yfinance period
+PERIOD_BARS = {"1d": 1, "5d": 5, "1mo": 21, "3mo": 63, "6mo": 126, "1y": 252}
+
+# Fear & Greed buckets (bisect_left: score <= 20 -> 0, ..., score > 80 -> 4)
+FG_THRESHOLDS = (20, 40, 60, 80)
+FG_RATINGS = ("Extreme Fear", "Fear", "Neutral", "Greed", "Extreme Greed")
+FG_SIGNALS = ("EXTREME_FEAR", "FEAR", "NEUTRAL", "GREED", "EXTREME_GREED")
+
+# VIX buckets (bisect_right: vix < 12 -> 0, ..., vix >= 40 -> 6)
+VIX_THRESHOLDS = (12, 15, 20, 25, 30, 40)
+VIX_LEVELS = (
+    ("EXTREME_COMPLACENCY", "extreme_low"),
+    ("BULLISH", "low"),
+    ("NEUTRAL", "normal"),
+    ("CAUTIOUS", "elevated"),
+    ("FEAR", "high"),
+    ("EXTREME_FEAR", "very_high"),
+    ("PANIC", "extreme_high")
+)
+VIX_INTERPRETATIONS = (
+    "Extreme complacency - be cautious of reversal",
+    "Market calm, investors confident",
+    "Normal volatility",
+    "Elevated concern",
+    "High fear, potential opportunity",
+    "Extreme fear - contrarian buy signal",
+    "Market panic! Strong contrarian buy signal"
+)
+
+# Advance ratio -> breadth signal (bisect_right: ratio >= cut)
+BREADTH_THRESHOLDS = (0.3, 0.45, 0.55, 0.7)
+BREADTH_SIGNALS = ("STRONG_BEARISH", "BEARISH", "NEUTRAL", "BULLISH", "STRONG_BULLISH")
+
+# Put/Call ratio -> contrarian signal (bisect_left: pcr > cut). High PCR =
+# heavy put buying = fear = contrarian bullish
+PCR_THRESHOLDS = (0.6, 0.8, 1.0, 1.2)
+PCR_SIGNALS = ("EXTREME_GREED", "GREED", "NEUTRAL", "FEAR", "EXTREME_FEAR")
+PCR_INTERPRETATIONS = (
+    "Extreme call buying = complacency (contrarian sell signal)",
+    "More calls than puts = optimism",
+    "Normal options activity",
+    "High put buying = fear (potential opportunity)",
+    "Extreme put buying = panic (contrarian buy signal)"
+)
+
+# DXY level -> signal (strong dollar pressures stocks), bisect_left buckets
+DXY_THRESHOLDS = (100, 105)
+DXY_SIGNALS = ("BULLISH", "NEUTRAL", "BEARISH")
+
+# Gold 1-week % change -> signal (a rally = flight to safety), bisect_left buckets.
+# RISK_ON needs a strict drop below -2%, so the lower cut sits one float under
+# -2 and exactly -2.00 stays NEUTRAL.
+GOLD_THRESHOLDS = (math.nextafter(-2.0, -math.inf), 1, 3)
+GOLD_SIGNALS = ("RISK_ON", "NEUTRAL", "CAUTIOUS", "FEAR")
+
+# Momentum score deltas, bucketed by distance so both tails keep strict
+# comparisons: 1m return by |ret| (sign applied after), RSI by |rsi - 50|
+MOMENTUM_RET_THRESHOLDS = (0, 2, 5)
+MOMENTUM_RET_DELTAS = (0, 5, 10, 15)
+MOMENTUM_RSI_THRESHOLDS = (10, 20)
+MOMENTUM_RSI_DELTAS_HIGH = (0, 5, -10)  # Overbought is penalized
+MOMENTUM_RSI_DELTAS_LOW = (0, 5, 15)    # Oversold is a buying opportunity
+MOMENTUM_RETURN_OFFSETS = np.array([-2, -5, -21, 0])  # 1d, 1w, 1m, 3m bases
+MOMENTUM_THRESHOLDS = (30, 45, 55, 70)  # bisect_right: score >= cut
+MOMENTUM_LEVELS = ("STRONG_BEARISH", "BEARISH", "NEUTRAL", "BULLISH", "STRONG_BULLISH")
+
+# Contrarian score contributions for calculate_ai_score (bisect_left buckets)
+FG_CONTRA_THRESHOLDS = (20, 40, 60, 80)
+FG_CONTRA_SCORES = (85, 70, 50, 35, 15)
+VIX_CONTRA_THRESHOLDS = (15, 20, 25, 35)
+VIX_CONTRA_SCORES = (35, 45, 50, 65, 80)
+
+# Signal -> score contributions for calculate_ai_score
+PCR_SCORES = MappingProxyType({
+    "EXTREME_FEAR": 80,
+    "FEAR": 65,
+    "NEUTRAL": 50,
+    "GREED": 35,
+    "EXTREME_GREED": 20
+})
+MA_SCORES = MappingProxyType({
+    "STRONG_BULLISH": 80,
+    "BULLISH": 65,
+    "NEUTRAL": 50,
+    "BEARISH": 35,
+    "STRONG_BEARISH": 20
+})
+INST_SCORES = MappingProxyType({
+    "STRONG_INFLOW": 80,
+    "INFLOW": 65,
+    "NEUTRAL": 50,
+    "OUTFLOW": 35,
+    "STRONG_OUTFLOW": 20
+})
+INTERNAL_SCORES = MappingProxyType({
+    "STRONG_BULLISH": 75,
+    "BULLISH": 60,
+    "NEUTRAL": 50,
+    "MIXED": 50,
+    "BEARISH": 40,
+    "STRONG_BEARISH": 25
+})
+
+# Recommendation buckets for the final score (bisect_right: score < 30 -> 0, ..., >= 75 -> 4)
+RECOMMENDATION_THRESHOLDS = (30, 45, 60, 75)
+RECOMMENDATIONS = (
+    ("AVOID", "Avoid buying, high risk", "หลีกเลี่ยงการซื้อ ความเสี่ยงสูง"),
+    ("CAUTIOUS", "Caution! Market has risks", "ระวัง! ตลาดมีความเสี่ยง"),
+    ("HOLD", "Normal conditions, wait for better opportunity", "สภาวะปกติ รอจังหวะที่ดีกว่า"),
+    ("BUY", "Good conditions, consider buying", "สภาวะค่อนข้างดี พิจารณาเข้าซื้อได้"),
+    ("STRONG_BUY", "Excellent conditions - Extreme Fear = Opportunity", "สภาวะดีเยี่ยม - Extreme Fear = โอกาสซื้อ")
+)
+LOW_CONFIDENCE_LEVELS = frozenset({"low", "very_low"})
+LOW_CONFIDENCE_NOTE = " (Low confidence - limited data)"
+LOW_CONFIDENCE_NOTE_TH = " (ความเชื่อมั่นต่ำ - ข้อมูลจำกัด)"
+
+# Overall deadline (seconds) for the concurrent indicator fetches
+FETCH_TIMEOUT = 90
+
+# Score components in calculate_ai_score order, with their weights (%)
+SCORE_COMPONENTS = (
+    "fear_greed", "vix", "breadth", "pcr", "sectors", "ma",
+    "yields", "momentum", "dxy", "institutional", "internals"
+)
+SCORE_WEIGHTS = np.array([18, 12, 12, 10, 8, 12, 5, 10, 4, 5, 4], dtype=np.float64)
+SCORE_WEIGHTS_TOTAL = float(SCORE_WEIGHTS.sum())
+
+# ETF universes
+BREADTH_INDICES = MappingProxyType({
+    "SPY": "S&P 500",
+    "QQQ": "NASDAQ 100",
+    "DIA": "Dow Jones",
+    "IWM": "Russell 2000",
+    "VTI": "Total Market",
+    "MDY": "Mid Cap",
+    "IJR": "Small Cap"
+})
+SECTOR_ETFS = MappingProxyType({
+    "XLK": "Technology",
+    "XLF": "Financials",
+    "XLE": "Energy",
+    "XLV": "Healthcare",
+    "XLI": "Industrials",
+    "XLY": "Consumer Disc.",
+    "XLP": "Consumer Staples",
+    "XLU": "Utilities",
+    "XLRE": "Real Estate",
+    "XLB": "Materials",
+    "XLC": "Communication"
+})
+# Symbols behind the short-TTL indicators (VIX, sectors). They are downloaded
+# only in a small 1mo batch that expires with them, not in the hourly 1y frame,
+# and every read of them (1d-1mo) is a tail of that batch.
+LIVE_SYMBOLS = ["^VIX", "^VIX3M", *SECTOR_ETFS]
+LIVE_PERIODS = frozenset({"1d", "5d", "1mo"})
+RISK_ON_SECTORS = frozenset({"Technology", "Consumer Disc.", "Financials", "Communication"})
+RISK_OFF_SECTORS = frozenset({"Utilities", "Consumer Staples", "Healthcare", "Real Estate"})
+FLOW_ETFS = MappingProxyType({
+    "SPY": "S&P 500",
+    "QQQ": "NASDAQ",
+    "IWM": "Small Cap",
+    "HYG": "High Yield Bonds",
+    "TLT": "Long-Term Treasuries"
+})
+RISK_ON_FLOW_ETFS = frozenset({"SPY", "QQQ", "IWM", "HYG"})
+
+
+# Per-site request headers (merged over the session's default User-Agent)
+CNN_HEADERS = MappingProxyType({
+    'Accept': 'application/json',
+    'Referer': 'https://edition.cnn.com/markets/fear-and-greed'
+})
+SCRAPE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+})
+
+
+def _create_session() -> requests.Session:
+    """HTTP session with keep-alive connection pooling and transient-error retries"""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False  # Let callers see the final status code
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    return session
+
+
+# Shared by all analyzers so connections to CNN/FRED/CBOE etc. stay warm.
+# Transient HTTP errors are retried by its adapter, so the scrapers below make
+# a single retry_on_failure attempt instead of repeating whole requests.
+SESSION = _create_session()
+
+
+class _HostLimiter:
+    """Token bucket (rate/s, burst) plus a cap on concurrent requests to one
+    host - pacing the scrapers avoids the 429s whose Retry-After backoff
+    costs far more than the wait"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 3, concurrency: int = 2):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(concurrency)
+
+    def __enter__(self):
+        self.slots.acquire()
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve a token now; a negative balance is the caller's wait
+            self.tokens -= 1
+            wait_for = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_for:
+            time.sleep(wait_for)
+        return self
+
+    def __exit__(self, *exc):
+        self.slots.release()
+        return False
+
+
+_HOST_LIMITERS: Dict[str, _HostLimiter] = {}
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+
+def _host_limiter(url: str) -> _HostLimiter:
+    """The shared limiter for url's host"""
+    host = urlsplit(url).netloc
+    with _HOST_LIMITERS_LOCK:
+        limiter = _HOST_LIMITERS.get(host)
+        if limiter is None:
+            limiter = _HOST_LIMITERS[host] = _HostLimiter()
+        return limiter
+
+
+@functools.lru_cache(maxsize=1)
+def _yf():
+    """yfinance module, imported on first use (it is slow to import)"""
+    import yfinance
+    return yfinance
+
+
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+
+
+def _chart_closes(symbol: str, period: str = "5d") -> np.ndarray:
+    """Daily closes straight from Yahoo's chart JSON - no DataFrame is built,
+    which is all a close-only reader needs for a symbol outside the batch"""
+    response = SESSION.get(
+        YAHOO_CHART_URL.format(symbol=quote(symbol, safe='')),
+        params={'range': period, 'interval': '1d'},
+        timeout=10
+    )
+    response.raise_for_status()
+    result = _json_loads(response.content)['chart']['result'][0]
+    close = result['indicators']['quote'][0]['close']
+    # Yahoo pads missing sessions with nulls
+    return np.array([c for c in close if c is not None], dtype=np.float64)
+
+
+def _sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average over every full window (single cumsum pass)"""
+    csum = np.cumsum(np.insert(values, 0, 0.0))
+    return (csum[period:] - csum[:-period]) / period
+
+
+def _ema(values: np.ndarray, span: int, block: int = 256) -> np.ndarray:
+    """Exponential moving average (pandas ewm(span, adjust=False) semantics).
+
+    The recurrence is unrolled in closed form with cumsum, restarting every
+    `block` bars so the decay powers stay well inside float64 range.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.empty_like(values)
+    if values.size == 0:
+        return out
+    alpha = 2.0 / (span + 1)
+    decay = 1.0 - alpha
+    if decay == 0.0:
+        out[:] = values
+        return out
+    prev = values[0]
+    for start in range(0, values.size, block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(1, chunk.size + 1)
+        out[start:start + chunk.size] = powers * (prev + alpha * np.cumsum(chunk / powers))
+        prev = out[start + chunk.size - 1]
+    return out
+
+
+@functools.lru_cache(maxsize=32)
+def _ema_weights(span: int, n: int) -> np.ndarray:
+    """Weights that turn the last n values into their final EMA (seed included)"""
+    alpha = 2.0 / (span + 1)
+    decay = 1.0 - alpha
+    weights = alpha * decay ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    weights[0] = decay ** (n - 1)  # The first value seeds the recursion
+    weights.setflags(write=False)
+    return weights
+
+
+def _ema_last(values: np.ndarray, span: int) -> float:
+    """Latest EMA value only (same semantics as _ema(values, span)[-1])"""
+    values = np.asarray(values, dtype=np.float64)
+    return float(_ema_weights(span, values.size) @ values)
+
+
+@functools.lru_cache(maxsize=8)
+def _macd_histogram_weights(n: int, fast: int = 12, slow: int = 26, signal: int = 9) -> np.ndarray:
+    """Weights w with w @ close == last MACD histogram value of n closes.
+
+    MACD and its signal line are linear in the closes, so the three EMA
+    recursions fold into one weight vector, built once per length.
+    """
+    def ema_rows(span: int) -> np.ndarray:
+        # Row t holds the coefficients of EMA_t over the n closes
+        alpha = 2.0 / (span + 1)
+        rows = np.eye(n)
+        for t in range(1, n):
+            rows[t] = rows[t - 1] + alpha * (rows[t] - rows[t - 1])
+        return rows
+    
+    macd_rows = ema_rows(fast) - ema_rows(slow)
+    weights = macd_rows[-1] - _ema_weights(signal, n) @ macd_rows
+    weights.setflags(write=False)
+    return weights
+
+
+def _sma_last(values: np.ndarray, period: int) -> float:
+    """Latest simple moving average value only (no intermediate series)"""
+    return float(values[-period:].sum() / period)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str):
+    """Create an output directory once per process"""
+    os.makedirs(path, exist_ok=True)
+
+
+def _write_atomic(path: str, payload: bytes):
+    """Write bytes via a temp file + rename so readers never see a partial file"""
+    directory = os.path.dirname(path) or '.'
+    _ensure_dir(directory)
+    # A unique temp file per write, so overlapping runs can't clobber each
+    # other's half-written file before the rename
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; keep outputs world-readable
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _to_native(obj):
+    """Recursively convert numpy scalars/arrays to plain Python JSON types"""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {str(k): _to_native(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_native(v) for v in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return _to_native(obj.tolist())
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    return str(obj)
+
 
 class MarketSentimentAnalyzer:
     def __init__(self):
         self.data = {}
-        self.cache = {}
+        self.cache = _CACHE
         self.cache_duration = 3600  # 1 hour cache for position trading
+        self.score_cache_duration = 300  # Final score is reused for 5 minutes
         self.confidence_factors = []  # Track data quality
-        
+        self.session = SESSION
+        self._lock = threading.RLock()  # Guards confidence across fetch threads
+        
+    def _get_cache_entry(self, key: str, ttl: Optional[float] = None) -> Optional[Dict]:
+        """Get cache entry (data + recorded confidence) if still valid"""
+        with _CACHE_LOCK:
+            entry = self.cache.get(key)
+        ttl = self._cache_ttl(key) if ttl is None else ttl
+        if entry and datetime.now().timestamp() - entry['timestamp'] < ttl:
+            return entry
+        return None
+    
+    def _cache_ttl(self, key: str) -> float:
+        """TTL for a cache key, stretched while the US market is closed"""
+        ttl = CACHE_TTL.get(key, self.cache_duration)
+        until_open = _seconds_to_open()
+        if not until_open:
+            return ttl
+        return max(ttl, min(ttl * OFF_HOURS_TTL_FACTOR, until_open))
+    
     def _get_cached(self, key: str) -> Optional[Dict]:
         """Get cached data if still valid"""
-        if key in self.cache:
-            cached = self.cache[key]
-            if datetime.now().timestamp() - cached['timestamp'] < self.cache_duration:
-                return cached['data']
-        return None
+        entry = self._get_cache_entry(key)
+        return entry['data'] if entry else None
     
-    def _set_cache(self, key: str, data: Dict):
+    def _set_cache(self, key: str, data: Dict, confidence: Optional[List[Dict]] = None):
         """Cache data with timestamp"""
-        self.cache[key] = {
-            'data': data,
-            'timestamp': datetime.now().timestamp()
-        }
+        with _CACHE_LOCK:
+            self.cache[key] = {
+                'data': data,
+                'timestamp': datetime.now().timestamp(),
+                'confidence': list(confidence or [])
+            }
+    
+    def _set_score_cache(self, result: MappingProxyType, confidence: List[Dict], version: int):
+        """Cache the final score along with the source version it was built from"""
+        self._set_cache('ai_score', result, confidence)
+        with _CACHE_LOCK:
+            self.cache['ai_score']['version'] = version
+    
+    def _disk_cache_path(self, key: str) -> str:
+        return os.path.join(DISK_CACHE_DIR, f"{hashlib.md5(f'sentiment_{key}'.encode()).hexdigest()}.json")
+    
+    def _get_disk_cache(self, key: str) -> Optional[Dict]:
+        """Load a persisted entry into the memory cache if still valid"""
+        path = self._disk_cache_path(key)
+        try:
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    stored = _json_loads(f.read())
+                # Judged by the save time in the payload, not the file mtime -
+                # a checkout or copy makes every file look freshly written
+                saved_at = stored.get('saved_at')
+                if saved_at and datetime.now().timestamp() - saved_at < self._cache_ttl(key):
+                    with _CACHE_LOCK:
+                        self.cache[key] = {
+                            'data': stored['data'],
+                            'timestamp': saved_at,
+                            'confidence': stored['confidence']
+                        }
+                    return self.cache[key]
+        except:
+            pass
+        return None
+    
+    def _set_disk_cache(self, key: str, data: Dict, confidence: List[Dict]):
+        """Persist a cache entry as JSON (best effort)"""
+        try:
+            payload = _json_dumps(_to_native({
+                'data': data,
+                'confidence': confidence,
+                'saved_at': datetime.now().timestamp()
+            }))
+            _write_atomic(self._disk_cache_path(key), payload)
+        except:
+            pass
     
     def _add_confidence(self, source: str, quality: str):
         """Track data source quality for confidence calculation"""
-        self.confidence_factors.append({
+        factor = {
             "source": source,
             "quality": quality  # "high", "medium", "low", "estimated"
-        })
+        }
+        for recorded in getattr(_confidence_recorders, 'stack', ()):
+            recorded.append(factor)
+        
+        with self._lock:
+            # A source reached twice (e.g. VIX via F&G fallback) counts once
+            if not any(f["source"] == source for f in self.confidence_factors):
+                self.confidence_factors.append(factor)
+
+    # ==================== Batch Price Download ====================
+    def _bulk_fetch(self, period: str = "1y", symbols: List[str] = BULK_SYMBOLS):
+        """Download symbols (all BULK_SYMBOLS by default) in a single
+        yf.download call, cached per period"""
+        key = f'bulk_{period}'
+        with _BULK_LOCK:
+            frame = self._get_cached(key)
+            if frame is not None:
+                return frame if frame is not False else None
+
+            try:
+                frame = _yf().download(
+                    symbols,
+                    period=period,
+                    group_by="ticker",
+                    auto_adjust=True,
+                    threads=True,
+                    progress=False
+                )
+                if frame is None or frame.empty:
+                    frame = None
+            except Exception as e:
+                log.warning("  [Bulk Download Error] %s", e)
+                frame = None
+
+            # Cache failures too, so every consumer doesn't retry the batch
+            self._set_cache(key, frame if frame is not None else False)
+            return frame
+
+    def _bulk_symbols(self) -> Dict[str, "pd.DataFrame"]:
+        """Per-symbol 1y daily bars, split out of the bulk download once"""
+        symbols = self._get_cached('bulk_1y_symbols')
+        if symbols is None:
+            frame = self._bulk_fetch()
+            symbols = {}
+            if frame is not None:
+                for symbol in frame.columns.get_level_values(0).unique():
+                    symbols[symbol] = frame[symbol].dropna(subset=["Close"])
+            self._set_cache('bulk_1y_symbols', symbols)
+        return symbols
+
+    def _history(self, symbol: str, period: str = "5d"):
+        """Daily bars for one symbol - a tail slice of its 1y bulk history"""
+        hist = self._bulk_symbols().get(symbol)
+
+        if hist is None or hist.empty:
+            # Symbol missing from the batch - fetch it on its own
+            return _yf().Ticker(symbol).history(period=period)
+
+        return hist.tail(PERIOD_BARS.get(period, len(hist)))
+
+    def _live_closes(self) -> Dict[str, np.ndarray]:
+        """Recent closes of LIVE_SYMBOLS from the short-lived 1mo batch"""
+        closes = self._get_cached('live_closes')
+        if closes is None:
+            frame = self._bulk_fetch("1mo", LIVE_SYMBOLS)
+            closes = {}
+            if frame is not None:
+                for name in frame.columns.get_level_values(0).unique():
+                    series = frame[name]['Close'].dropna().to_numpy(dtype=np.float64, copy=True)
+                    series.setflags(write=False)  # Shared by every caller
+                    closes[name] = series
+            self._set_cache('live_closes', closes)
+        return closes
+
+    def _close_prices(self, symbol: str, period: str = "5d") -> np.ndarray:
+        """Close prices for one symbol as a float64 array (a view into the
+        cached 1y closes, so repeated reads of SPY etc. allocate nothing)"""
+        if period in LIVE_PERIODS and symbol in LIVE_SYMBOLS:
+            close = self._live_closes().get(symbol)
+            if close is not None and close.size:
+                return close[-PERIOD_BARS[period]:]
+        
+        closes = self._get_cached('bulk_1y_closes')
+        if closes is None:
+            closes = {}
+            for name, hist in self._bulk_symbols().items():
+                series = hist['Close'].to_numpy(dtype=np.float64, copy=True)
+                series.setflags(write=False)  # Shared by every caller
+                closes[name] = series
+            self._set_cache('bulk_1y_closes', closes)
+        
+        close = closes.get(symbol)
+        if close is None or close.size == 0:
+            # Symbol missing from the batch - its chart JSON is much cheaper
+            # than a yfinance history frame
+            try:
+                close = _chart_closes(symbol, period)
+                if close.size:
+                    return close
+            except Exception as e:
+                log.debug("  [Chart Fallback] %s: %s", symbol, e)
+            hist = self._history(symbol, period)
+            return hist['Close'].to_numpy(dtype=np.float64) if hist.shape[0] else np.empty(0)
+        return close[-PERIOD_BARS.get(period, close.size):]
+
+    def _closes(self, symbols: List[str], period: str = "5d") -> Dict[str, np.ndarray]:
+        """Close prices for several symbols, each over its own bars (gaps are
+        dropped per symbol; one that can't be loaded maps to an empty array)"""
+        closes = {}
+        for symbol in symbols:
+            try:
+                closes[symbol] = self._close_prices(symbol, period)
+            except Exception as e:
+                log.debug("  [Closes] %s: %s", symbol, e)
+                closes[symbol] = np.empty(0)
+        return closes
 
     # ==================== VIX (CBOE Volatility Index) ====================
+    @cached('vix', persist=True)
     @retry_on_failure(max_retries=3)
     def get_vix(self) -> Dict:
         """ดึง VIX จาก Yahoo Finance พร้อม retry logic"""
-        cached = self._get_cached('vix')
-        if cached:
-            return cached
-            
-        import yfinance as yf
-        vix = yf.Ticker("^VIX")
-        hist = vix.history(period="5d")
+        close = self._close_prices("^VIX", "5d")
         
-        if hist.empty:
+        if close.size == 0:
             self._add_confidence("vix", "low")
             return self._default_vix()
         
-        current = float(hist['Close'].iloc[-1])
-        prev = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current
+        current = float(close[-1])
+        prev = float(close[-2]) if close.size > 1 else current
         change = ((current - prev) / prev) * 100
         
         # VIX Interpretation (refined thresholds)
-        if current < 12:
-            signal, level = "EXTREME_COMPLACENCY", "extreme_low"
-        elif current < 15:
-            signal, level = "BULLISH", "low"
-        elif current < 20:
-            signal, level = "NEUTRAL", "normal"
-        elif current < 25:
-            signal, level = "CAUTIOUS", "elevated"
-        elif current < 30:
-            signal, level = "FEAR", "high"
-        elif current < 40:
-            signal, level = "EXTREME_FEAR", "very_high"
-        else:
-            signal, level = "PANIC", "extreme_high"
+        signal, level = VIX_LEVELS[bisect.bisect_right(VIX_THRESHOLDS, current)]
         
         # VIX term structure (contango vs backwardation)
         vix_term = self._get_vix_term_structure()
@@ -168,26 +939,20 @@ class MarketSentimentAnalyzer:
             "interpretation": self._interpret_vix(current)
         }
         
-        self._set_cache('vix', result)
         return result
     
     def _get_vix_term_structure(self) -> Dict:
         """Check VIX term structure (contango = normal, backwardation = fear)"""
         try:
-            import yfinance as yf
-            
             # VIX (spot) vs VIX3M (3-month)
-            vix = yf.Ticker("^VIX")
-            vix3m = yf.Ticker("^VIX3M")
+            vix_close = self._close_prices("^VIX", "1d")
+            vix3m_close = self._close_prices("^VIX3M", "1d")
             
-            vix_hist = vix.history(period="1d")
-            vix3m_hist = vix3m.history(period="1d")
-            
-            if vix_hist.empty or vix3m_hist.empty:
+            if vix_close.size == 0 or vix3m_close.size == 0:
                 return {"structure": "unknown", "ratio": 1.0}
             
-            spot = float(vix_hist['Close'].iloc[-1])
-            term = float(vix3m_hist['Close'].iloc[-1])
+            spot = float(vix_close[-1])
+            term = float(vix3m_close[-1])
             ratio = spot / term
             
             if ratio > 1.1:
@@ -210,28 +975,24 @@ class MarketSentimentAnalyzer:
         return {"value": 20, "change": 0, "signal": "NEUTRAL", "level": "normal", "trend": "flat", "source": "default"}
     
     def _interpret_vix(self, vix: float) -> str:
-        if vix < 12: return "Extreme complacency - be cautious of reversal"
-        elif vix < 15: return "Market calm, investors confident"
-        elif vix < 20: return "Normal volatility"
-        elif vix < 25: return "Elevated concern"
-        elif vix < 30: return "High fear, potential opportunity"
-        elif vix < 40: return "Extreme fear - contrarian buy signal"
-        else: return "Market panic! Strong contrarian buy signal"
+        return VIX_INTERPRETATIONS[bisect.bisect_right(VIX_THRESHOLDS, vix)]
 
     # ==================== Fear & Greed Index ====================
-    def get_fear_greed_index(self) -> Dict:
-        """ดึง Fear & Greed Index จากหลายแหล่ง"""
-        cached = self._get_cached('fear_greed')
-        if cached:
-            return cached
-            
-        # Try CNN first
-        stock_fg = self._get_cnn_fear_greed()
-        if not stock_fg:
-            stock_fg = self._calculate_fear_greed_fallback()
-        
-        # Crypto F&G
-        crypto_fg = self._get_crypto_fear_greed()
+    def get_fear_greed_index(self, include_crypto: bool = True) -> Dict:
+        """ดึง Fear & Greed Index จากหลายแหล่ง
+
+        With include_crypto=False the crypto index is left as None so callers
+        that only score the stock index can fetch it off the critical path.
+        """
+        if include_crypto:
+            # Crypto F&G is independent of CNN - fetch it while CNN is in flight
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                crypto_future = executor.submit(_with_recorders(self._get_crypto_fear_greed))
+                stock_fg = self._get_stock_fear_greed()
+                crypto_fg = crypto_future.result()
+        else:
+            stock_fg = self._get_stock_fear_greed()
+            crypto_fg = None
         
         result = {
             "stock": stock_fg,
@@ -242,29 +1003,27 @@ class MarketSentimentAnalyzer:
             "source": stock_fg["source"]
         }
         
-        self._set_cache('fear_greed', result)
         return result
     
-    @retry_on_failure(max_retries=2)
+    @cached('stock_fear_greed', persist=True)
+    def _get_stock_fear_greed(self) -> Dict:
+        """Stock F&G - CNN first, calculated fallback otherwise"""
+        return self._get_cnn_fear_greed() or self._calculate_fear_greed_fallback()
+    
+    @retry_on_failure(max_retries=1)
     def _get_cnn_fear_greed(self) -> Optional[Dict]:
         """ดึง Fear & Greed Index จาก CNN API"""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json',
-            'Referer': 'https://edition.cnn.com/markets/fear-and-greed'
-        }
-        
         url = 'https://production.dataviz.cnn.io/index/fearandgreed/graphdata'
-        resp = requests.get(url, headers=headers, timeout=10)
+        resp = self.session.get(url, headers=CNN_HEADERS, timeout=10)
         
         if resp.status_code == 200:
-            data = resp.json()
+            data = _json_loads(resp.content)
             fg = data.get('fear_and_greed', {})
             
             score = int(fg.get('score', 50))
             rating = fg.get('rating', 'neutral').title()
             
-            print(f"  [CNN F&G] Score: {score} ({rating})")
+            log.debug("  [CNN F&G] Score: %s (%s)", score, rating)
             self._add_confidence("fear_greed", "high")
             
             return {
@@ -280,43 +1039,50 @@ class MarketSentimentAnalyzer:
     
     def _calculate_fear_greed_fallback(self) -> Dict:
         """Fallback: คำนวณ Fear & Greed จาก indicators"""
-        scores = []
+        components = {}
         
-        try:
-            import yfinance as yf
+        # VIX and safe haven are cached fetches of their own - start them
+        # while momentum/RSI are computed from SPY here
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            vix_future = executor.submit(_with_recorders(self.get_vix))
+            safe_haven_future = executor.submit(_with_recorders(self._get_safe_haven_score))
             
             # 1. S&P 500 Momentum
-            spy = yf.Ticker("SPY")
-            hist = spy.history(period="6mo")
-            if not hist.empty and len(hist) >= 125:
-                price = hist['Close'].iloc[-1]
-                ma125 = hist['Close'].rolling(125).mean().iloc[-1]
-                momentum_score = min(100, max(0, 50 + (price - ma125) / ma125 * 500))
-                scores.append(("momentum", momentum_score))
+            rsi = None
+            try:
+                close = self._close_prices("SPY", "6mo")
+                rsi = self._calculate_rsi(close) if close.size else 50
+                if close.size >= 125:
+                    price = close[-1]
+                    ma125 = _sma_last(close, 125)
+                    components["momentum"] = min(100, max(0, 50 + (price - ma125) / ma125 * 500))
+            except Exception as e:
+                log.warning("  [F&G Calc Error] %s", e)
             
             # 2. VIX (inverted)
-            vix_data = self.get_vix()
-            vix_val = vix_data["value"]
-            vix_score = max(0, min(100, 100 - (vix_val - 10) * 3.33))
-            scores.append(("vix", vix_score))
+            try:
+                vix_val = vix_future.result()["value"]
+                components["vix"] = max(0, min(100, 100 - (vix_val - 10) * 3.33))
+            except Exception as e:
+                log.warning("  [F&G Calc Error] %s", e)
             
             # 3. Safe Haven Demand
-            safe_haven = self._get_safe_haven_score()
-            scores.append(("safe_haven", safe_haven))
-            
-            # 4. RSI
-            rsi = self._calculate_rsi(hist['Close']) if not hist.empty else 50
-            scores.append(("rsi", rsi))
-            
-        except Exception as e:
-            print(f"  [F&G Calc Error] {e}")
+            try:
+                safe_haven = safe_haven_future.result()
+                components["safe_haven"] = 50 if safe_haven is None else safe_haven
+            except Exception as e:
+                log.warning("  [F&G Calc Error] %s", e)
         
-        if not scores:
+        # 4. RSI
+        if rsi is not None:
+            components["rsi"] = rsi
+        
+        if not components:
             self._add_confidence("fear_greed", "low")
             return {"score": 50, "rating": "Neutral", "signal": "HOLD", "source": "default"}
         
-        avg_score = sum(s[1] for s in scores) / len(scores)
-        final_score = round(avg_score)
+        scores = np.fromiter(components.values(), dtype=np.float64, count=len(components))
+        final_score = round(float(scores.mean()))
         
         self._add_confidence("fear_greed", "medium")
         
@@ -325,15 +1091,16 @@ class MarketSentimentAnalyzer:
             "rating": self._score_to_rating(final_score),
             "signal": self._score_to_signal(final_score),
             "source": "calculated",
-            "components": {name: round(val) for name, val in scores}
+            "components": {name: round(val) for name, val in components.items()}
         }
 
-    @retry_on_failure(max_retries=2)
+    @cached('crypto_fear_greed', persist=True)
+    @retry_on_failure(max_retries=1)
     def _get_crypto_fear_greed(self) -> Dict:
         """Crypto Fear & Greed จาก alternative.me"""
         url = "https://api.alternative.me/fng/?limit=1"
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
+        resp = self.session.get(url, timeout=10)
+        data = _json_loads(resp.content)
         
         if data.get("data"):
             score = int(data["data"][0]["value"])
@@ -345,82 +1112,61 @@ class MarketSentimentAnalyzer:
                 "signal": self._score_to_signal(score),
                 "source": "alternative.me"
             }
-        return {"score": 50, "rating": "Neutral", "signal": "HOLD", "source": "default"}
+        # No data - same as a failed request, so nothing gets cached
+        return None
     
-    def _get_safe_haven_score(self) -> float:
-        """Safe haven demand: TLT vs SPY"""
+    @cached('safe_haven', persist=True)
+    def _get_safe_haven_score(self) -> Optional[float]:
+        """Safe haven demand: TLT vs SPY (None when prices are unavailable)"""
         try:
-            import yfinance as yf
-            spy = yf.Ticker("SPY")
-            tlt = yf.Ticker("TLT")
+            spy_close = self._close_prices("SPY", "1mo")
+            tlt_close = self._close_prices("TLT", "1mo")
             
-            spy_hist = spy.history(period="1mo")
-            tlt_hist = tlt.history(period="1mo")
-            
-            if spy_hist.empty or tlt_hist.empty:
-                return 50
+            if spy_close.size == 0 or tlt_close.size == 0:
+                return None
             
-            spy_return = (spy_hist['Close'].iloc[-1] - spy_hist['Close'].iloc[0]) / spy_hist['Close'].iloc[0]
-            tlt_return = (tlt_hist['Close'].iloc[-1] - tlt_hist['Close'].iloc[0]) / tlt_hist['Close'].iloc[0]
+            spy_return = (spy_close[-1] - spy_close[0]) / spy_close[0]
+            tlt_return = (tlt_close[-1] - tlt_close[0]) / tlt_close[0]
             
             diff = spy_return - tlt_return
             return min(100, max(0, 50 + diff * 500))
         except:
-            return 50
+            return None
     
     def _score_to_rating(self, score: float) -> str:
-        if score <= 20: return "Extreme Fear"
-        elif score <= 40: return "Fear"
-        elif score <= 60: return "Neutral"
-        elif score <= 80: return "Greed"
-        else: return "Extreme Greed"
+        return FG_RATINGS[bisect.bisect_left(FG_THRESHOLDS, score)]
     
     def _score_to_signal(self, score: float) -> str:
-        if score <= 20: return "EXTREME_FEAR"
-        elif score <= 40: return "FEAR"
-        elif score <= 60: return "NEUTRAL"
-        elif score <= 80: return "GREED"
-        else: return "EXTREME_GREED"
+        return FG_SIGNALS[bisect.bisect_left(FG_THRESHOLDS, score)]
 
     # ==================== Market Breadth (Enhanced with Real Data) ====================
+    @cached('breadth', persist=True)
     def get_market_breadth(self) -> Dict:
         """Market breadth analysis with real Advance/Decline data"""
-        cached = self._get_cached('breadth')
-        if cached:
-            return cached
-        
         # Try real Advance/Decline data first (Barchart)
         real_breadth = self._get_barchart_advance_decline()
         if real_breadth:
-            self._set_cache('breadth', real_breadth)
             return real_breadth
         
-        # Try WSJ as backup
+        # Try WSJ as backup - only scraped when Barchart came back empty
         wsj_breadth = self._get_wsj_advance_decline()
         if wsj_breadth:
-            self._set_cache('breadth', wsj_breadth)
             return wsj_breadth
         
         # Fallback to ETF proxy
-        etf_breadth = self._get_etf_breadth()
-        self._set_cache('breadth', etf_breadth)
-        return etf_breadth
+        return self._get_etf_breadth()
     
-    @retry_on_failure(max_retries=2)
+    @retry_on_failure(max_retries=1)
     def _get_barchart_advance_decline(self) -> Optional[Dict]:
         """Get real NYSE Advance/Decline from Barchart"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
             url = "https://www.barchart.com/stocks/market-performance"
-            resp = requests.get(url, headers=headers, timeout=15)
+            with _host_limiter(url):
+                resp = self.session.get(url, headers=SCRAPE_HEADERS, timeout=15)
             
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, 'html.parser')
+                from bs4 import BeautifulSoup, SoupStrainer
+                soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=SoupStrainer('table'))
                 
                 # Look for advance/decline data in the page
                 # Barchart shows NYSE and NASDAQ breadth
@@ -451,13 +1197,17 @@ class MarketSentimentAnalyzer:
                                                     declines = num
                                     except:
                                         continue
+                        
+                        # First breadth table wins - skip the rest of the page
+                        if advances or declines:
+                            break
                 
                 # If we found data
                 if advances > 0 or declines > 0:
                     total = advances + declines + unchanged
                     ratio = advances / total if total > 0 else 0.5
                     
-                    print(f"  [Barchart] Advances: {advances}, Declines: {declines}")
+                    log.debug("  [Barchart] Advances: %s, Declines: %s", advances, declines)
                     self._add_confidence("breadth", "high")
                     
                     return {
@@ -473,19 +1223,16 @@ class MarketSentimentAnalyzer:
             
             return None
         except Exception as e:
-            print(f"  [Barchart Error] {e}")
+            log.warning("  [Barchart Error] %s", e)
             return None
     
-    @retry_on_failure(max_retries=2)
+    @retry_on_failure(max_retries=1)
     def _get_wsj_advance_decline(self) -> Optional[Dict]:
         """Backup: Get Advance/Decline from WSJ"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
             url = "https://www.wsj.com/market-data/stocks"
-            resp = requests.get(url, headers=headers, timeout=15)
+            with _host_limiter(url):
+                resp = self.session.get(url, timeout=15)
             
             if resp.status_code == 200:
                 # Parse for advance/decline numbers
@@ -493,8 +1240,8 @@ class MarketSentimentAnalyzer:
                 text = resp.text
                 
                 # Look for patterns like "Advancing: 1,234" or "Advances 1234"
-                adv_match = re.search(r'advanc\w*[:\s]+(\d[\d,]*)', text, re.I)
-                dec_match = re.search(r'declin\w*[:\s]+(\d[\d,]*)', text, re.I)
+                adv_match = ADVANCES_RE.search(text)
+                dec_match = DECLINES_RE.search(text)
                 
                 if adv_match and dec_match:
                     advances = int(adv_match.group(1).replace(',', ''))
@@ -503,7 +1250,7 @@ class MarketSentimentAnalyzer:
                     total = advances + declines
                     ratio = advances / total if total > 0 else 0.5
                     
-                    print(f"  [WSJ] Advances: {advances}, Declines: {declines}")
+                    log.debug("  [WSJ] Advances: %s, Declines: %s", advances, declines)
                     self._add_confidence("breadth", "high")
                     
                     return {
@@ -518,47 +1265,25 @@ class MarketSentimentAnalyzer:
             
             return None
         except Exception as e:
-            print(f"  [WSJ Error] {e}")
+            log.warning("  [WSJ Error] %s", e)
             return None
     
     def _breadth_signal(self, ratio: float) -> str:
         """Convert breadth ratio to signal"""
-        if ratio >= 0.7:
-            return "STRONG_BULLISH"
-        elif ratio >= 0.55:
-            return "BULLISH"
-        elif ratio >= 0.45:
-            return "NEUTRAL"
-        elif ratio >= 0.3:
-            return "BEARISH"
-        else:
-            return "STRONG_BEARISH"
+        return BREADTH_SIGNALS[bisect.bisect_right(BREADTH_THRESHOLDS, ratio)]
     
     @retry_on_failure(max_retries=3)
     def _get_etf_breadth(self) -> Dict:
         """ETF-based market breadth (fallback)"""
-        import yfinance as yf
-        
-        indices = {
-            "SPY": "S&P 500",
-            "QQQ": "NASDAQ 100",
-            "DIA": "Dow Jones",
-            "IWM": "Russell 2000",
-            "VTI": "Total Market",
-            "MDY": "Mid Cap",
-            "IJR": "Small Cap"
-        }
-        
         results = {}
         bullish, bearish, neutral = 0, 0, 0
         
-        for symbol, name in indices.items():
+        for symbol, name in BREADTH_INDICES.items():
             try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="5d")
+                close = self._close_prices(symbol, "5d")
                 
-                if not hist.empty and len(hist) >= 2:
-                    change = (hist['Close'].iloc[-1] - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100
+                if close.size >= 2:
+                    change = (close[-1] - close[-2]) / close[-2] * 100
                     
                     if change > 0.1:
                         bullish += 1
@@ -602,85 +1327,80 @@ class MarketSentimentAnalyzer:
         }
 
     # ==================== Put/Call Ratio (Real CBOE Data) ====================
+    @cached('pcr', persist=True)
     def get_put_call_ratio(self) -> Dict:
         """Get Put/Call ratio - try CBOE first, then estimate"""
-        cached = self._get_cached('pcr')
-        if cached:
-            return cached
-        
         # Try CBOE scraping first
         cboe_pcr = self._get_cboe_put_call()
         if cboe_pcr:
-            self._set_cache('pcr', cboe_pcr)
             return cboe_pcr
         
         # Fallback to estimation
-        estimated_pcr = self._estimate_put_call_ratio()
-        self._set_cache('pcr', estimated_pcr)
-        return estimated_pcr
+        return self._estimate_put_call_ratio()
     
-    @retry_on_failure(max_retries=2)
+    @retry_on_failure(max_retries=1)
     def _get_cboe_put_call(self) -> Optional[Dict]:
         """Get real Put/Call ratio from CBOE"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
             # CBOE Put/Call Ratio page
             url = "https://www.cboe.com/us/options/market_statistics/daily/"
-            resp = requests.get(url, headers=headers, timeout=15)
+            with _host_limiter(url):
+                resp = self.session.get(url, headers=SCRAPE_HEADERS, timeout=15)
             
             if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, 'html.parser')
+                from bs4 import BeautifulSoup, SoupStrainer
+                soup = BeautifulSoup(resp.text, HTML_PARSER, parse_only=SoupStrainer('table'))
                 
                 # Look for equity put/call ratio
                 # CBOE shows: Total, Index, Equity P/C ratios
                 pcr_equity = None
                 pcr_total = None
                 
-                # Try to find in tables or data elements
-                tables = soup.find_all('table')
-                for table in tables:
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        cells = row.find_all(['td', 'th'])
-                        text = row.get_text().lower()
-                        
-                        if 'equity' in text and 'put' in text:
-                            for cell in cells:
-                                try:
-                                    val = float(cell.get_text().strip())
-                                    if 0.3 < val < 2.0:  # Valid PCR range
-                                        pcr_equity = val
-                                        break
-                                except:
-                                    continue
-                        
-                        if 'total' in text and 'put' in text:
-                            for cell in cells:
-                                try:
-                                    val = float(cell.get_text().strip())
-                                    if 0.3 < val < 2.0:
-                                        pcr_total = val
-                                        break
-                                except:
-                                    continue
+                # Only tables were parsed, so every row is a table row; stop
+                # once both ratios are found
+                for row in soup.find_all('tr'):
+                    cells = row.find_all(['td', 'th'])
+                    text = row.get_text().lower()
+                    
+                    if 'equity' in text and 'put' in text:
+                        for cell in cells:
+                            try:
+                                val = float(cell.get_text().strip())
+                                if 0.3 < val < 2.0:  # Valid PCR range
+                                    pcr_equity = val
+                                    break
+                            except:
+                                continue
+                    
+                    if 'total' in text and 'put' in text:
+                        for cell in cells:
+                            try:
+                                val = float(cell.get_text().strip())
+                                if 0.3 < val < 2.0:
+                                    pcr_total = val
+                                    break
+                            except:
+                                continue
+                    
+                    if pcr_equity and pcr_total:
+                        break
                 
-                # Also try regex on page content
+                # Also try regex on page content: a ratio right after
+                # "equity" first, then the first plausible ratio anywhere
                 if not pcr_equity:
                     text = resp.text
-                    # Look for patterns like "0.85" near "equity" or "put/call"
-                    matches = re.findall(r'(\d\.\d{2})', text)
-                    for match in matches:
-                        val = float(match)
-                        if 0.5 < val < 1.5:
-                            pcr_equity = val
-                            break
+                    match = EQUITY_PCR_RE.search(text)
+                    if match and 0.5 < float(match.group(1)) < 1.5:
+                        pcr_equity = float(match.group(1))
+                    else:
+                        for match in PCR_VALUE_RE.finditer(text):
+                            val = float(match.group(1))
+                            if 0.5 < val < 1.5:
+                                pcr_equity = val
+                                break
                 
                 if pcr_equity:
-                    print(f"  [CBOE] Equity P/C Ratio: {pcr_equity}")
+                    log.debug("  [CBOE] Equity P/C Ratio: %s", pcr_equity)
                     self._add_confidence("pcr", "high")
                     
                     return {
@@ -694,25 +1414,22 @@ class MarketSentimentAnalyzer:
             
             return None
         except Exception as e:
-            print(f"  [CBOE Error] {e}")
+            log.warning("  [CBOE Error] %s", e)
             return None
     
-    @retry_on_failure(max_retries=2)
+    @retry_on_failure(max_retries=1)
     def _estimate_put_call_ratio(self) -> Dict:
         """Estimate Put/Call ratio from VIX and options ETFs"""
         try:
-            import yfinance as yf
-            
             # Use VIX as proxy
-            vix = yf.Ticker("^VIX")
-            vix_hist = vix.history(period="1mo")
+            vix_close = self._close_prices("^VIX", "1mo")
             
-            if vix_hist.empty:
+            if vix_close.size == 0:
                 self._add_confidence("pcr", "low")
                 return {"ratio": 1.0, "signal": "NEUTRAL", "source": "default"}
             
-            current_vix = float(vix_hist['Close'].iloc[-1])
-            avg_vix = float(vix_hist['Close'].mean())
+            current_vix = float(vix_close[-1])
+            avg_vix = float(np.nanmean(vix_close))
             
             # Estimate PCR from VIX level
             # High VIX = more puts = higher PCR
@@ -729,38 +1446,19 @@ class MarketSentimentAnalyzer:
                 "note": "Estimated - CBOE data unavailable"
             }
         except Exception as e:
-            print(f"  [PCR Estimate Error] {e}")
+            log.warning("  [PCR Estimate Error] %s", e)
             self._add_confidence("pcr", "low")
             return {"ratio": 1.0, "signal": "NEUTRAL", "source": "default"}
     
     def _pcr_signal(self, pcr: float) -> str:
         """Convert PCR to signal (contrarian)"""
-        # PCR > 1.0 = more puts = bearish sentiment = contrarian bullish
-        # PCR < 0.7 = more calls = bullish sentiment = contrarian bearish
-        if pcr > 1.2:
-            return "EXTREME_FEAR"  # Contrarian bullish
-        elif pcr > 1.0:
-            return "FEAR"
-        elif pcr > 0.8:
-            return "NEUTRAL"
-        elif pcr > 0.6:
-            return "GREED"
-        else:
-            return "EXTREME_GREED"  # Contrarian bearish
+        return PCR_SIGNALS[bisect.bisect_left(PCR_THRESHOLDS, pcr)]
     
     def _pcr_interpretation(self, pcr: float) -> str:
-        if pcr > 1.2:
-            return "Extreme put buying = panic (contrarian buy signal)"
-        elif pcr > 1.0:
-            return "High put buying = fear (potential opportunity)"
-        elif pcr > 0.8:
-            return "Normal options activity"
-        elif pcr > 0.6:
-            return "More calls than puts = optimism"
-        else:
-            return "Extreme call buying = complacency (contrarian sell signal)"
+        return PCR_INTERPRETATIONS[bisect.bisect_left(PCR_THRESHOLDS, pcr)]
 
     # ==================== Economic Calendar ====================
+    @cached(lambda: f'calendar_{datetime.now().date()}')
     def get_economic_calendar(self) -> Dict:
         """Check upcoming economic events that impact market sentiment"""
         today = datetime.now().date()
@@ -769,42 +1467,25 @@ class MarketSentimentAnalyzer:
         upcoming_events = []
         event_impact = "none"
         
-        # Check each event type
-        for event_type, dates in ECONOMIC_CALENDAR_2025.items():
-            for date_str in dates:
-                try:
-                    event_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                    days_until = (event_date - today).days
-                    
-                    # Events within next 3 days
-                    if 0 <= days_until <= 3:
-                        event_name = {
-                            "fomc": "FOMC Meeting (Fed Rate Decision)",
-                            "cpi": "CPI Report (Inflation)",
-                            "jobs": "Jobs Report (Non-Farm Payrolls)",
-                            "gdp": "GDP Report",
-                            "pce": "PCE Report (Fed's Inflation Measure)"
-                        }.get(event_type, event_type.upper())
-                        
-                        impact = "high" if event_type in ["fomc", "cpi", "jobs", "pce"] else "medium"
-                        
-                        upcoming_events.append({
-                            "event": event_name,
-                            "date": date_str,
-                            "days_until": days_until,
-                            "impact": impact
-                        })
-                        
-                        # Set highest impact
-                        if impact == "high" and days_until <= 1:
-                            event_impact = "high"
-                        elif impact == "medium" and event_impact != "high":
-                            event_impact = "medium"
-                except:
-                    continue
-        
-        # Sort by days until
-        upcoming_events.sort(key=lambda x: x["days_until"])
+        # Events within the next 3 days - a slice of the date-sorted calendar
+        start = bisect.bisect_left(ECONOMIC_EVENT_DATES, today)
+        end = bisect.bisect_right(ECONOMIC_EVENT_DATES, today + timedelta(days=EVENT_LOOKAHEAD_DAYS))
+        for event_date, event_type, date_str in ECONOMIC_EVENTS[start:end]:
+            days_until = (event_date - today).days
+            impact = "high" if event_type in HIGH_IMPACT_EVENTS else "medium"
+            
+            upcoming_events.append({
+                "event": ECONOMIC_EVENT_NAMES.get(event_type, event_type.upper()),
+                "date": date_str,
+                "days_until": days_until,
+                "impact": impact
+            })
+            
+            # Set highest impact
+            if impact == "high" and days_until <= 1:
+                event_impact = "high"
+            elif impact == "medium" and event_impact != "high":
+                event_impact = "medium"
         
         # Determine signal
         if event_impact == "high":
@@ -830,35 +1511,43 @@ class MarketSentimentAnalyzer:
         }
 
     # ==================== Market Internals (TICK, TRIN) ====================
+    @cached('internals', persist=True)
     def get_market_internals(self) -> Dict:
         """Get market internals - TICK and TRIN/Arms Index proxies"""
-        cached = self._get_cached('internals')
-        if cached:
-            return cached
-        
         try:
-            import yfinance as yf
-            
             # TICK proxy: Use intraday momentum of major indices
             # Real TICK measures upticks vs downticks on NYSE
             # We approximate using ETF momentum
             
-            spy = yf.Ticker("SPY")
-            qqq = yf.Ticker("QQQ")
-            iwm = yf.Ticker("IWM")
-            
-            spy_hist = spy.history(period="1d", interval="5m")
-            qqq_hist = qqq.history(period="1d", interval="5m")
-            iwm_hist = iwm.history(period="1d", interval="5m")
+            # One batched request for all three intraday series
+            intraday = _yf().download(
+                ["SPY", "QQQ", "IWM"],
+                period="1d",
+                interval="5m",
+                group_by="ticker",
+                auto_adjust=True,
+                threads=True,
+                progress=False
+            )
+            
+            def intraday_change(symbol: str) -> Optional[float]:
+                if intraday is None or intraday.empty or symbol not in intraday.columns.get_level_values(0):
+                    return None
+                bars = intraday[symbol].dropna(subset=["Open", "Close"])
+                if bars.empty:
+                    return None
+                first_open = float(bars['Open'].to_numpy()[0])
+                last_close = float(bars['Close'].to_numpy()[-1])
+                return (last_close - first_open) / first_open * 100
             
             tick_proxy = 0
             trin_proxy = 1.0
             
-            if not spy_hist.empty:
+            spy_change = intraday_change("SPY")
+            if spy_change is not None:
                 # Calculate intraday momentum
-                spy_change = (spy_hist['Close'].iloc[-1] - spy_hist['Open'].iloc[0]) / spy_hist['Open'].iloc[0] * 100
-                qqq_change = (qqq_hist['Close'].iloc[-1] - qqq_hist['Open'].iloc[0]) / qqq_hist['Open'].iloc[0] * 100 if not qqq_hist.empty else 0
-                iwm_change = (iwm_hist['Close'].iloc[-1] - iwm_hist['Open'].iloc[0]) / iwm_hist['Open'].iloc[0] * 100 if not iwm_hist.empty else 0
+                qqq_change = intraday_change("QQQ") or 0
+                iwm_change = intraday_change("IWM") or 0
                 
                 # TICK proxy: scale to typical TICK range (-1000 to +1000)
                 avg_change = (spy_change + qqq_change + iwm_change) / 3
@@ -914,11 +1603,10 @@ class MarketSentimentAnalyzer:
                 "source": "proxy_calculation"
             }
             
-            self._set_cache('internals', result)
             return result
             
         except Exception as e:
-            print(f"  [Internals Error] {e}")
+            log.warning("  [Internals Error] %s", e)
             self._add_confidence("internals", "low")
             return {
                 "tick": {"value": 0, "signal": "NEUTRAL"},
@@ -928,57 +1616,34 @@ class MarketSentimentAnalyzer:
             }
 
     # ==================== Sector Performance ====================
+    @cached('sectors', persist=True)
     @retry_on_failure(max_retries=3)
     def get_sector_performance(self) -> Dict:
         """Sector ETF performance analysis"""
-        cached = self._get_cached('sectors')
-        if cached:
-            return cached
-            
-        import yfinance as yf
-        
-        sectors = {
-            "XLK": "Technology",
-            "XLF": "Financials",
-            "XLE": "Energy",
-            "XLV": "Healthcare",
-            "XLI": "Industrials",
-            "XLY": "Consumer Disc.",
-            "XLP": "Consumer Staples",
-            "XLU": "Utilities",
-            "XLRE": "Real Estate",
-            "XLB": "Materials",
-            "XLC": "Communication"
-        }
+        # Each ETF over its own bars, so a missing latest print for one sector
+        # doesn't drop the others; changes are then computed in a single pass
+        closes = self._closes(list(SECTOR_ETFS), "5d")
+        symbols = [symbol for symbol, close in closes.items() if close.size >= 2]
         
         results = []
-        for symbol, name in sectors.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="5d")
-                
-                if not hist.empty and len(hist) >= 2:
-                    change_1d = (hist['Close'].iloc[-1] - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100
-                    change_5d = (hist['Close'].iloc[-1] - hist['Close'].iloc[0]) / hist['Close'].iloc[0] * 100
-                    
-                    results.append({
-                        "symbol": symbol,
-                        "name": name,
-                        "change_1d": round(change_1d, 2),
-                        "change_5d": round(change_5d, 2)
-                    })
-            except:
-                continue
-        
-        results.sort(key=lambda x: x["change_1d"], reverse=True)
+        if symbols:
+            last = np.array([closes[symbol][-1] for symbol in symbols])
+            change_1d = (last / np.array([closes[symbol][-2] for symbol in symbols]) - 1) * 100
+            change_5d = (last / np.array([closes[symbol][0] for symbol in symbols]) - 1) * 100
+            
+            # Best 1d performer first
+            for i in np.argsort(-change_1d, kind='stable'):
+                results.append({
+                    "symbol": symbols[i],
+                    "name": SECTOR_ETFS[symbols[i]],
+                    "change_1d": round(float(change_1d[i]), 2),
+                    "change_5d": round(float(change_5d[i]), 2)
+                })
         
         # Risk-on vs Risk-off analysis
         top_sectors = [r["name"] for r in results[:3]]
-        risk_on = ["Technology", "Consumer Disc.", "Financials", "Communication"]
-        risk_off = ["Utilities", "Consumer Staples", "Healthcare", "Real Estate"]
-        
-        risk_on_score = sum(1 for s in top_sectors if s in risk_on)
-        risk_off_score = sum(1 for s in top_sectors if s in risk_off)
+        risk_on_score = sum(1 for s in top_sectors if s in RISK_ON_SECTORS)
+        risk_off_score = sum(1 for s in top_sectors if s in RISK_OFF_SECTORS)
         
         if risk_on_score > risk_off_score:
             rotation = "RISK_ON"
@@ -997,36 +1662,36 @@ class MarketSentimentAnalyzer:
             "signal": "BULLISH" if rotation == "RISK_ON" else "BEARISH" if rotation == "RISK_OFF" else "NEUTRAL"
         }
         
-        self._set_cache('sectors', result)
         return result
 
     # ==================== Moving Averages (Enhanced with EMA) ====================
+    @cached(lambda use_ema=True: f'ma_{use_ema}', persist=True)
     def get_moving_averages(self, use_ema: bool = True) -> Dict:
         """Moving average analysis for S&P 500"""
-        cached = self._get_cached(f'ma_{use_ema}')
-        if cached:
-            return cached
-            
         try:
-            import yfinance as yf
-            spy = yf.Ticker("SPY")
-            hist = spy.history(period="1y")
+            close = self._close_prices("SPY", "1y")
             
-            if hist.empty or len(hist) < 200:
+            if close.size < 200:
                 self._add_confidence("ma", "low")
                 return {"trend": "NEUTRAL", "ma50_above_ma200": True}
             
-            price = float(hist['Close'].iloc[-1])
+            price = float(close[-1])
             
             if use_ema:
-                ma20 = float(hist['Close'].ewm(span=20, adjust=False).mean().iloc[-1])
-                ma50 = float(hist['Close'].ewm(span=50, adjust=False).mean().iloc[-1])
-                ma200 = float(hist['Close'].ewm(span=200, adjust=False).mean().iloc[-1])
+                # Full 50/200 series are computed once and reused by the cross scan
+                ma50_hist = _ema(close, 50)
+                ma200_hist = _ema(close, 200)
+                ma20 = _ema_last(close, 20)
+                ma50 = float(ma50_hist[-1])
+                ma200 = float(ma200_hist[-1])
                 ma_type = "EMA"
             else:
-                ma20 = float(hist['Close'].rolling(20).mean().iloc[-1])
-                ma50 = float(hist['Close'].rolling(50).mean().iloc[-1])
-                ma200 = float(hist['Close'].rolling(200).mean().iloc[-1])
+                # Both arrays end at the latest bar, so negative indices line up
+                ma50_hist = _sma(close, 50)
+                ma200_hist = _sma(close, 200)
+                ma20 = _sma_last(close, 20)
+                ma50 = _sma_last(close, 50)
+                ma200 = _sma_last(close, 200)
                 ma_type = "SMA"
             
             # Count bullish signals
@@ -1049,26 +1714,17 @@ class MarketSentimentAnalyzer:
             else:
                 trend = "STRONG_BEARISH"
             
-            # Golden Cross / Death Cross detection
+            # Golden Cross / Death Cross detection over the recent bars
+            # (earliest sign flip wins). SMA200 covers only close.size - 199
+            # bars, so short histories scan fewer pairs.
             cross = None
-            if use_ema:
-                ma50_hist = hist['Close'].ewm(span=50, adjust=False).mean()
-                ma200_hist = hist['Close'].ewm(span=200, adjust=False).mean()
-            else:
-                ma50_hist = hist['Close'].rolling(50).mean()
-                ma200_hist = hist['Close'].rolling(200).mean()
-            
-            for i in range(-5, -1):
-                if len(ma50_hist) > abs(i) and len(ma200_hist) > abs(i):
-                    prev_diff = ma50_hist.iloc[i-1] - ma200_hist.iloc[i-1]
-                    curr_diff = ma50_hist.iloc[i] - ma200_hist.iloc[i]
-                    
-                    if prev_diff < 0 and curr_diff > 0:
-                        cross = "GOLDEN_CROSS"
-                        break
-                    elif prev_diff > 0 and curr_diff < 0:
-                        cross = "DEATH_CROSS"
-                        break
+            bars = min(5, ma200_hist.size - 1)
+            diff = ma50_hist[-bars - 1:-1] - ma200_hist[-bars - 1:-1]
+            golden = (diff[:-1] < 0) & (diff[1:] > 0)
+            death = (diff[:-1] > 0) & (diff[1:] < 0)
+            hits = np.flatnonzero(golden | death)
+            if hits.size:
+                cross = "GOLDEN_CROSS" if golden[hits[0]] else "DEATH_CROSS"
             
             dist_ma20 = ((price - ma20) / ma20) * 100
             dist_ma50 = ((price - ma50) / ma50) * 100
@@ -1094,83 +1750,93 @@ class MarketSentimentAnalyzer:
                 "bullish_signals": signals
             }
             
-            self._set_cache(f'ma_{use_ema}', result)
             return result
             
         except Exception as e:
-            print(f"  [MA Error] {e}")
+            log.warning("  [MA Error] %s", e)
             self._add_confidence("ma", "low")
             return {"trend": "NEUTRAL", "ma50_above_ma200": True, "ma_type": "EMA" if use_ema else "SMA"}
 
     # ==================== Treasury Yields ====================
+    @cached('yields', persist=True)
     def get_treasury_yields(self) -> Dict:
         """Treasury yield analysis with FRED API fallback"""
-        cached = self._get_cached('yields')
-        if cached:
-            return cached
-        
         fred_result = self._get_yield_from_fred()
         if fred_result:
-            self._set_cache('yields', fred_result)
             return fred_result
         
-        yahoo_result = self._get_yields_from_yahoo()
-        self._set_cache('yields', yahoo_result)
-        return yahoo_result
+        return self._get_yields_from_yahoo()
     
-    @retry_on_failure(max_retries=2)
+    @retry_on_failure(max_retries=1)
     def _get_yield_from_fred(self) -> Optional[Dict]:
         """Get yield spread from FRED"""
         try:
-            url = "https://fred.stlouisfed.org/graph/fredgraph.csv?id=T10Y3M"
-            resp = requests.get(url, timeout=10)
+            # Only the latest observation is needed - ask for the last month
+            # instead of the full history and stream it line by line
+            start = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+            url = f"https://fred.stlouisfed.org/graph/fredgraph.csv?id=T10Y3M&cosd={start}"
+            
+            # Conditional GET: an unchanged series answers 304 with no body
+            headers = {}
+            validator = _FRED_VALIDATORS.get('T10Y3M')
+            if validator:
+                headers['If-Modified-Since'] = validator[0]
+            
+            with self.session.get(url, headers=headers, timeout=10, stream=True) as resp:
+                if resp.status_code == 304 and validator:
+                    last_value = validator[1]
+                elif resp.status_code != 200:
+                    return None
+                else:
+                    last_value = None
+                    lines = resp.iter_lines(decode_unicode=True)
+                    next(lines, None)  # Header
+                    for line in lines:
+                        _, _, value = line.partition(',')
+                        value = value.strip()
+                        if value and value != '.':
+                            last_value = value
+                    
+                    last_modified = resp.headers.get('Last-Modified')
+                    if last_modified and last_value is not None:
+                        _FRED_VALIDATORS['T10Y3M'] = (last_modified, last_value)
             
-            if resp.status_code == 200:
-                lines = resp.text.strip().split('\n')
-                if len(lines) > 1:
-                    for line in reversed(lines[1:]):
-                        parts = line.split(',')
-                        if len(parts) >= 2 and parts[1] and parts[1] != '.':
-                            spread = float(parts[1])
-                            inverted = spread < 0
-                            
-                            print(f"  [FRED] 10Y-3M Spread: {spread}% ({'Inverted' if inverted else 'Normal'})")
-                            self._add_confidence("yields", "high")
-                            
-                            return {
-                                "yields": {"spread_10y_3m": spread},
-                                "spread": spread,
-                                "inverted": inverted,
-                                "signal": "BEARISH" if inverted else "NEUTRAL",
-                                "interpretation": "Yield curve inverted - recession warning" if inverted else "Normal yield curve",
-                                "source": "FRED"
-                            }
+            if last_value is not None:
+                spread = float(last_value)
+                inverted = spread < 0
+                
+                log.debug("  [FRED] 10Y-3M Spread: %s%% (%s)", spread, 'Inverted' if inverted else 'Normal')
+                self._add_confidence("yields", "high")
+                
+                return {
+                    "yields": {"spread_10y_3m": spread},
+                    "spread": spread,
+                    "inverted": inverted,
+                    "signal": "BEARISH" if inverted else "NEUTRAL",
+                    "interpretation": "Yield curve inverted - recession warning" if inverted else "Normal yield curve",
+                    "source": "FRED"
+                }
         except Exception as e:
-            print(f"  [FRED Error] {e}")
+            log.warning("  [FRED Error] %s", e)
         return None
     
     @retry_on_failure(max_retries=2)
     def _get_yields_from_yahoo(self) -> Dict:
         """Fallback: Get yields from Yahoo Finance"""
         try:
-            import yfinance as yf
-            
             yields = {}
             
-            tnx = yf.Ticker("^TNX")
-            hist_10y = tnx.history(period="5d")
-            if not hist_10y.empty:
-                yields["10Y"] = round(float(hist_10y['Close'].iloc[-1]), 3)
+            close_10y = self._close_prices("^TNX", "5d")
+            if close_10y.size:
+                yields["10Y"] = round(float(close_10y[-1]), 3)
             
-            fvx = yf.Ticker("^FVX")
-            hist_5y = fvx.history(period="5d")
-            if not hist_5y.empty:
-                yields["5Y"] = round(float(hist_5y['Close'].iloc[-1]), 3)
+            close_5y = self._close_prices("^FVX", "5d")
+            if close_5y.size:
+                yields["5Y"] = round(float(close_5y[-1]), 3)
             
-            irx = yf.Ticker("^IRX")
-            hist_3m = irx.history(period="5d")
-            if not hist_3m.empty:
-                yields["3M"] = round(float(hist_3m['Close'].iloc[-1]), 3)
+            close_3m = self._close_prices("^IRX", "5d")
+            if close_3m.size:
+                yields["3M"] = round(float(close_3m[-1]), 3)
             
             spread = 0
             inverted = False
@@ -1190,51 +1856,54 @@ class MarketSentimentAnalyzer:
                 "source": "yahoo_finance"
             }
         except Exception as e:
-            print(f"  [Yahoo Yields Error] {e}")
+            log.warning("  [Yahoo Yields Error] %s", e)
             self._add_confidence("yields", "low")
             return {"yields": {}, "inverted": False, "signal": "NEUTRAL", "spread": 0}
 
     # ==================== RSI Calculation ====================
     def _calculate_rsi(self, prices, period: int = 14) -> float:
-        """Calculate RSI (Relative Strength Index)"""
+        """Calculate RSI (Relative Strength Index, Wilder smoothing)"""
         try:
-            if len(prices) < period + 1:
+            close = np.asarray(prices, dtype=np.float64)
+            if close.size < period + 1:
                 return 50
             
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
+            # Wilder's smoothing: seed with the mean of the first `period` moves,
+            # then avg = avg * (period - 1) / period + move / period. Only the
+            # last value is needed, so the recurrence collapses to one dot product
+            delta = np.diff(close)
+            gains = np.clip(delta, 0, None)
+            losses = np.clip(-delta, 0, None)
+            decay = (period - 1) / period
+            weights = decay ** np.arange(delta.size - period - 1, -1, -1)
+            seed_weight = decay ** (delta.size - period)
+            gain = gains[:period].mean() * seed_weight + gains[period:] @ weights / period
+            loss = losses[:period].mean() * seed_weight + losses[period:] @ weights / period
+            
+            if loss == 0:
+                return 100.0 if gain > 0 else 50.0
             rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return float(rsi.iloc[-1])
+            return float(100 - (100 / (1 + rs)))
         except:
             return 50
 
     # ==================== Dollar Index (DXY) ====================
+    @cached('dxy', persist=True)
     @retry_on_failure(max_retries=2)
     def get_dollar_index(self) -> Dict:
         """Get US Dollar Index (DXY)"""
         try:
-            import yfinance as yf
-            
-            dxy = yf.Ticker("DX-Y.NYB")
-            hist = dxy.history(period="1mo")
+            close = self._close_prices("DX-Y.NYB", "1mo")
             
-            if hist.empty:
+            if close.size == 0:
                 self._add_confidence("dxy", "low")
                 return {"value": 100, "change": 0, "signal": "NEUTRAL"}
             
-            current = float(hist['Close'].iloc[-1])
-            prev = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current
+            current = float(close[-1])
+            prev = float(close[-2]) if close.size > 1 else current
             change = ((current - prev) / prev) * 100
             
-            if current > 105:
-                signal = "BEARISH"
-            elif current > 100:
-                signal = "NEUTRAL"
-            else:
-                signal = "BULLISH"
+            signal = DXY_SIGNALS[bisect.bisect_left(DXY_THRESHOLDS, current)]
             
             self._add_confidence("dxy", "high")
             
@@ -1245,39 +1914,30 @@ class MarketSentimentAnalyzer:
                 "interpretation": "Strong dollar pressures stocks" if current > 105 else "Weak dollar supports stocks" if current < 95 else "Dollar neutral"
             }
         except Exception as e:
-            print(f"  [DXY Error] {e}")
+            log.warning("  [DXY Error] %s", e)
             self._add_confidence("dxy", "low")
             return {"value": 100, "change": 0, "signal": "NEUTRAL"}
 
     # ==================== Gold (Safe Haven) ====================
+    @cached('gold', persist=True)
     @retry_on_failure(max_retries=2)
     def get_gold_sentiment(self) -> Dict:
         """Gold price analysis - safe haven indicator"""
         try:
-            import yfinance as yf
+            close = self._close_prices("GC=F", "1mo")
             
-            gold = yf.Ticker("GC=F")
-            hist = gold.history(period="1mo")
-            
-            if hist.empty:
+            if close.size == 0:
                 self._add_confidence("gold", "low")
                 return {"value": 2000, "change": 0, "signal": "NEUTRAL"}
             
-            current = float(hist['Close'].iloc[-1])
-            prev_day = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current
-            prev_week = float(hist['Close'].iloc[-5]) if len(hist) > 5 else current
+            current = float(close[-1])
+            prev_day = float(close[-2]) if close.size > 1 else current
+            prev_week = float(close[-5]) if close.size > 5 else current
             
             change_1d = ((current - prev_day) / prev_day) * 100
             change_1w = ((current - prev_week) / prev_week) * 100
             
-            if change_1w > 3:
-                signal = "FEAR"
-            elif change_1w > 1:
-                signal = "CAUTIOUS"
-            elif change_1w < -2:
-                signal = "RISK_ON"
-            else:
-                signal = "NEUTRAL"
+            signal = GOLD_SIGNALS[bisect.bisect_left(GOLD_THRESHOLDS, change_1w)]
             
             self._add_confidence("gold", "high")
             
@@ -1289,68 +1949,42 @@ class MarketSentimentAnalyzer:
                 "interpretation": "Gold rising = flight to safety" if change_1w > 2 else "Gold stable"
             }
         except Exception as e:
-            print(f"  [Gold Error] {e}")
+            log.warning("  [Gold Error] %s", e)
             self._add_confidence("gold", "low")
             return {"value": 2000, "change_1d": 0, "change_1w": 0, "signal": "NEUTRAL"}
 
     # ==================== Market Momentum ====================
+    @cached('momentum', persist=True)
     @retry_on_failure(max_retries=2)
     def get_market_momentum(self) -> Dict:
         """Calculate market momentum using multiple timeframes"""
         try:
-            import yfinance as yf
+            close = self._close_prices("SPY", "3mo")
             
-            spy = yf.Ticker("SPY")
-            hist = spy.history(period="3mo")
-            
-            if hist.empty or len(hist) < 60:
+            if close.size < 60:
                 self._add_confidence("momentum", "low")
                 return {"momentum": "NEUTRAL", "score": 50}
             
-            price = float(hist['Close'].iloc[-1])
-            
-            ret_1d = (price - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100
-            ret_1w = (price - hist['Close'].iloc[-5]) / hist['Close'].iloc[-5] * 100 if len(hist) >= 5 else 0
-            ret_1m = (price - hist['Close'].iloc[-21]) / hist['Close'].iloc[-21] * 100 if len(hist) >= 21 else 0
-            ret_3m = (price - hist['Close'].iloc[0]) / hist['Close'].iloc[0] * 100
+            # 1d / 1w / 1m / 3m returns in one indexed pass (size >= 60 here)
+            bases = close[MOMENTUM_RETURN_OFFSETS]
+            ret_1d, ret_1w, ret_1m, ret_3m = ((close[-1] - bases) / bases * 100).tolist()
             
-            rsi = self._calculate_rsi(hist['Close'])
+            rsi = self._calculate_rsi(close)
             
-            ema12 = hist['Close'].ewm(span=12, adjust=False).mean()
-            ema26 = hist['Close'].ewm(span=26, adjust=False).mean()
-            macd = ema12 - ema26
-            signal_line = macd.ewm(span=9, adjust=False).mean()
-            macd_histogram = float(macd.iloc[-1] - signal_line.iloc[-1])
+            macd_histogram = float(_macd_histogram_weights(close.size) @ close)
             
             score = 50
             
-            if ret_1m > 5: score += 15
-            elif ret_1m > 2: score += 10
-            elif ret_1m > 0: score += 5
-            elif ret_1m < -5: score -= 15
-            elif ret_1m < -2: score -= 10
-            elif ret_1m < 0: score -= 5
-            
-            if rsi > 70: score -= 10
-            elif rsi > 60: score += 5
-            elif rsi < 30: score += 15
-            elif rsi < 40: score += 5
-            
-            if macd_histogram > 0: score += 10
-            else: score -= 5
-            
-            score = max(0, min(100, score))
-            
-            if score >= 70:
-                momentum = "STRONG_BULLISH"
-            elif score >= 55:
-                momentum = "BULLISH"
-            elif score >= 45:
-                momentum = "NEUTRAL"
-            elif score >= 30:
-                momentum = "BEARISH"
-            else:
-                momentum = "STRONG_BEARISH"
+            ret_delta = MOMENTUM_RET_DELTAS[bisect.bisect_left(MOMENTUM_RET_THRESHOLDS, abs(ret_1m))]
+            score += ret_delta if ret_1m > 0 else -ret_delta
+            
+            rsi_deltas = MOMENTUM_RSI_DELTAS_HIGH if rsi > 50 else MOMENTUM_RSI_DELTAS_LOW
+            score += rsi_deltas[bisect.bisect_left(MOMENTUM_RSI_THRESHOLDS, abs(rsi - 50))]
+            
+            score += 10 if macd_histogram > 0 else -5
+            
+            score = 0 if score < 0 else 100 if score > 100 else score
+            momentum = MOMENTUM_LEVELS[bisect.bisect_right(MOMENTUM_THRESHOLDS, score)]
             
             self._add_confidence("momentum", "high")
             
@@ -1367,43 +2001,35 @@ class MarketSentimentAnalyzer:
                 "macd_histogram": round(macd_histogram, 3)
             }
         except Exception as e:
-            print(f"  [Momentum Error] {e}")
+            log.warning("  [Momentum Error] %s", e)
             self._add_confidence("momentum", "low")
             return {"momentum": "NEUTRAL", "score": 50}
 
     # ==================== Institutional Flow (New) ====================
+    @cached('inst_flow', persist=True)
     @retry_on_failure(max_retries=2)
     def get_institutional_flow(self) -> Dict:
         """Estimate institutional flow from ETF volume and price action"""
         try:
-            import yfinance as yf
-            
-            # Track major ETF flows
-            etfs = {
-                "SPY": "S&P 500",
-                "QQQ": "NASDAQ",
-                "IWM": "Small Cap",
-                "HYG": "High Yield Bonds",
-                "TLT": "Long-Term Treasuries"
-            }
-            
             flows = {}
             risk_on_flow = 0
             risk_off_flow = 0
             
-            for symbol, name in etfs.items():
+            # Track major ETF flows
+            for symbol, name in FLOW_ETFS.items():
                 try:
-                    ticker = yf.Ticker(symbol)
-                    hist = ticker.history(period="5d")
+                    hist = self._history(symbol, "5d")
                     
-                    if not hist.empty and len(hist) >= 2:
+                    if hist.shape[0] >= 2:
                         # Volume trend
-                        avg_vol = hist['Volume'].mean()
-                        today_vol = hist['Volume'].iloc[-1]
+                        volume = hist['Volume'].to_numpy()
+                        close = hist['Close'].to_numpy()
+                        avg_vol = volume.mean()
+                        today_vol = volume[-1]
                         vol_ratio = today_vol / avg_vol if avg_vol > 0 else 1
                         
                         # Price change
-                        price_change = (hist['Close'].iloc[-1] - hist['Close'].iloc[-2]) / hist['Close'].iloc[-2] * 100
+                        price_change = (close[-1] - close[-2]) / close[-2] * 100
                         
                         # Flow estimate: volume * direction
                         flow_score = vol_ratio * (1 if price_change > 0 else -1) * abs(price_change)
@@ -1416,7 +2042,7 @@ class MarketSentimentAnalyzer:
                         }
                         
                         # Categorize
-                        if symbol in ["SPY", "QQQ", "IWM", "HYG"]:
+                        if symbol in RISK_ON_FLOW_ETFS:
                             risk_on_flow += flow_score
                         else:
                             risk_off_flow += flow_score
@@ -1448,7 +2074,7 @@ class MarketSentimentAnalyzer:
                 "interpretation": "Institutions buying risk assets" if net_flow > 0 else "Institutions moving to safety"
             }
         except Exception as e:
-            print(f"  [Institutional Flow Error] {e}")
+            log.warning("  [Institutional Flow Error] %s", e)
             self._add_confidence("institutional", "low")
             return {"signal": "NEUTRAL", "net_flow": 0}
 
@@ -1488,102 +2114,111 @@ class MarketSentimentAnalyzer:
         }
 
     # ==================== AI Score Calculation (Enhanced v3.0) ====================
-    def calculate_ai_score(self) -> Dict:
-        """Calculate comprehensive AI market score with all indicators"""
-        print("=" * 60)
-        print("🤖 Analyzing Market Sentiment v3.0 (Enhanced)")
-        print("=" * 60)
+    def calculate_ai_score(self, now: Optional[datetime] = None) -> Dict:
+        """Calculate comprehensive AI market score with all indicators
+
+        `now` is the tick time stamped on the result (defaults to the call time).
+        """
+        updated_at = (now or datetime.now()).isoformat()
+        
+        # Repeated calls (polling) within the score TTL reuse the last result
+        entry = self._get_cache_entry('ai_score', ttl=self.score_cache_duration)
+        if entry is not None:
+            log.info("  ♻️ Using cached market score")
+            self.confidence_factors = list(entry['confidence'])
+            return {**entry['data'], "updated_at": updated_at}
+        
+        started = time.perf_counter()
+        log.info("=" * 60)
+        log.info("🤖 Analyzing Market Sentiment v3.0 (Enhanced)")
+        log.info("=" * 60)
         
         # Reset confidence tracking
         self.confidence_factors = []
         
-        print("  📊 Fetching VIX...")
-        vix = self.get_vix() or {"value": 20, "signal": "NEUTRAL"}
-        
-        print("  😱 Calculating Fear & Greed...")
-        fear_greed = self.get_fear_greed_index()
-        
-        print("  📈 Analyzing Market Breadth (Real A/D)...")
-        breadth = self.get_market_breadth()
+        log.debug("  📦 Downloading market data (batch)...")
+        self._bulk_fetch()
+        
+        # Indicators are independent I/O-bound fetches - run them concurrently
+        fetchers = [
+            ("vix", "  📊 Fetching VIX...", self.get_vix),
+            ("fear_greed", "  😱 Calculating Fear & Greed...", lambda: self.get_fear_greed_index(include_crypto=False)),
+            ("crypto_fg", "  🪙 Fetching Crypto Fear & Greed...", self._get_crypto_fear_greed),
+            ("breadth", "  📈 Analyzing Market Breadth (Real A/D)...", self.get_market_breadth),
+            ("pcr", "  📞 Getting Put/Call Ratio (CBOE)...", self.get_put_call_ratio),
+            ("sectors", "  🏭 Analyzing Sectors...", self.get_sector_performance),
+            ("ma", "  📉 Analyzing Moving Averages (EMA)...", lambda: self.get_moving_averages(use_ema=True)),
+            ("yields", "  💰 Checking Treasury Yields...", self.get_treasury_yields),
+            ("momentum", "  🚀 Analyzing Market Momentum...", self.get_market_momentum),
+            ("dxy", "  💵 Checking Dollar Index...", self.get_dollar_index),
+            ("gold", "  🥇 Checking Gold...", self.get_gold_sentiment),
+            ("calendar", "  📅 Checking Economic Calendar...", self.get_economic_calendar),
+            ("internals", "  📊 Getting Market Internals...", self.get_market_internals),
+            ("inst_flow", "  🏦 Estimating Institutional Flow...", self.get_institutional_flow),
+        ]
+        
+        executor = ThreadPoolExecutor(max_workers=8)
+        futures = {}
+        for name, label, fetch in fetchers:
+            log.debug(label)
+            futures[name] = executor.submit(fetch)
+        
+        # Don't let one hung source stall the whole score - late ones score neutral
+        done, _ = wait(futures.values(), timeout=FETCH_TIMEOUT)
+        executor.shutdown(wait=False, cancel_futures=True)
         
-        print("  📞 Getting Put/Call Ratio (CBOE)...")
-        pcr = self.get_put_call_ratio()
-        
-        print("  🏭 Analyzing Sectors...")
-        sectors = self.get_sector_performance()
-        
-        print("  📉 Analyzing Moving Averages (EMA)...")
-        ma = self.get_moving_averages(use_ema=True)
-        
-        print("  💰 Checking Treasury Yields...")
-        yields = self.get_treasury_yields()
-        
-        print("  🚀 Analyzing Market Momentum...")
-        momentum = self.get_market_momentum()
-        
-        print("  💵 Checking Dollar Index...")
-        dxy = self.get_dollar_index()
-        
-        print("  🥇 Checking Gold...")
-        gold = self.get_gold_sentiment()
-        
-        print("  📅 Checking Economic Calendar...")
-        calendar = self.get_economic_calendar()
-        
-        print("  📊 Getting Market Internals...")
-        internals = self.get_market_internals()
-        
-        print("  🏦 Estimating Institutional Flow...")
-        inst_flow = self.get_institutional_flow()
+        results = {}
+        for name, future in futures.items():
+            if future in done:
+                results[name] = future.result()
+            else:
+                log.warning("  [Timeout] %s did not finish in %ss", name, FETCH_TIMEOUT)
+                results[name] = None
+        
+        # Every source answered from cache with the same data as last time -
+        # the previous score still holds, skip re-scoring
+        version = _CACHE_VERSION
+        with _CACHE_LOCK:
+            previous = self.cache.get('ai_score')
+        if len(done) == len(futures) and previous is not None and previous.get('version') == version:
+            log.info("  ♻️ Sources unchanged - reusing market score")
+            self._set_score_cache(previous['data'], previous['confidence'], version)
+            self.confidence_factors = list(previous['confidence'])
+            return {**previous['data'], "updated_at": updated_at}
+        
+        vix = results["vix"] or {"value": 20, "signal": "NEUTRAL"}
+        fear_greed = results["fear_greed"] or {}
+        fear_greed["crypto"] = results["crypto_fg"]  # Reference only - not scored
+        breadth = results["breadth"] or {}
+        pcr = results["pcr"] or {}
+        sectors = results["sectors"] or {}
+        ma = results["ma"] or {}
+        yields = results["yields"] or {}
+        momentum = results["momentum"] or {}
+        dxy = results["dxy"] or {}
+        gold = results["gold"] or {}
+        calendar = results["calendar"] or {}
+        internals = results["internals"] or {}
+        inst_flow = results["inst_flow"] or {}
         
         # Calculate weighted score with improved weights
         scores = []
-        weights = []
         
         # 1. Fear & Greed (18%) - Contrarian
         fg_score = fear_greed.get("score", 50)
-        if fg_score <= 20:
-            scores.append(85)
-        elif fg_score <= 40:
-            scores.append(70)
-        elif fg_score <= 60:
-            scores.append(50)
-        elif fg_score <= 80:
-            scores.append(35)
-        else:
-            scores.append(15)
-        weights.append(18)
+        scores.append(FG_CONTRA_SCORES[bisect.bisect_left(FG_CONTRA_THRESHOLDS, fg_score)])
         
         # 2. VIX (12%) - Contrarian
         vix_val = vix.get("value", 20)
-        if vix_val > 35:
-            scores.append(80)
-        elif vix_val > 25:
-            scores.append(65)
-        elif vix_val > 20:
-            scores.append(50)
-        elif vix_val > 15:
-            scores.append(45)
-        else:
-            scores.append(35)
-        weights.append(12)
+        scores.append(VIX_CONTRA_SCORES[bisect.bisect_left(VIX_CONTRA_THRESHOLDS, vix_val)])
         
         # 3. Market Breadth (12%)
         breadth_score = breadth.get("score", 50)
         scores.append(breadth_score)
-        weights.append(12)
         
         # 4. Put/Call Ratio (10%) - Contrarian
         pcr_signal = pcr.get("signal", "NEUTRAL")
-        pcr_scores = {
-            "EXTREME_FEAR": 80,
-            "FEAR": 65,
-            "NEUTRAL": 50,
-            "GREED": 35,
-            "EXTREME_GREED": 20
-        }
-        scores.append(pcr_scores.get(pcr_signal, 50))
-        weights.append(10)
+        scores.append(PCR_SCORES.get(pcr_signal, 50))
         
         # 5. Sector Rotation (8%)
         rotation = sectors.get("rotation", "MIXED")
@@ -1593,31 +2228,20 @@ class MarketSentimentAnalyzer:
             scores.append(30)
         else:
             scores.append(50)
-        weights.append(8)
         
         # 6. Moving Averages (12%)
         ma_trend = ma.get("trend", "NEUTRAL")
-        ma_scores = {
-            "STRONG_BULLISH": 80,
-            "BULLISH": 65,
-            "NEUTRAL": 50,
-            "BEARISH": 35,
-            "STRONG_BEARISH": 20
-        }
-        scores.append(ma_scores.get(ma_trend, 50))
-        weights.append(12)
+        scores.append(MA_SCORES.get(ma_trend, 50))
         
         # 7. Yield Curve (5%)
         if yields.get("inverted"):
             scores.append(25)
         else:
             scores.append(55)
-        weights.append(5)
         
         # 8. Momentum (10%)
         momentum_score = momentum.get("score", 50)
         scores.append(momentum_score)
-        weights.append(10)
         
         # 9. Dollar Index (4%)
         dxy_signal = dxy.get("signal", "NEUTRAL")
@@ -1627,35 +2251,18 @@ class MarketSentimentAnalyzer:
             scores.append(35)
         else:
             scores.append(50)
-        weights.append(4)
         
         # 10. Institutional Flow (5%)
         inst_signal = inst_flow.get("signal", "NEUTRAL")
-        inst_scores = {
-            "STRONG_INFLOW": 80,
-            "INFLOW": 65,
-            "NEUTRAL": 50,
-            "OUTFLOW": 35,
-            "STRONG_OUTFLOW": 20
-        }
-        scores.append(inst_scores.get(inst_signal, 50))
-        weights.append(5)
+        scores.append(INST_SCORES.get(inst_signal, 50))
         
         # 11. Market Internals (4%)
         internal_signal = internals.get("combined_signal", "NEUTRAL")
-        internal_scores = {
-            "STRONG_BULLISH": 75,
-            "BULLISH": 60,
-            "NEUTRAL": 50,
-            "MIXED": 50,
-            "BEARISH": 40,
-            "STRONG_BEARISH": 25
-        }
-        scores.append(internal_scores.get(internal_signal, 50))
-        weights.append(4)
+        scores.append(INTERNAL_SCORES.get(internal_signal, 50))
         
         # Calculate final score
-        total_score = sum(s * w for s, w in zip(scores, weights)) / sum(weights)
+        score_values = np.fromiter(scores, dtype=np.float64, count=SCORE_WEIGHTS.size)
+        total_score = float(score_values @ SCORE_WEIGHTS / SCORE_WEIGHTS_TOTAL)
         
         # Apply economic calendar adjustment
         if calendar.get("event_impact") == "high":
@@ -1668,33 +2275,16 @@ class MarketSentimentAnalyzer:
         confidence = self.calculate_confidence()
         
         # Generate recommendation with confidence
-        if final_score >= 75:
-            recommendation = "STRONG_BUY"
-            message = "Excellent conditions - Extreme Fear = Opportunity"
-            message_th = "สภาวะดีเยี่ยม - Extreme Fear = โอกาสซื้อ"
-        elif final_score >= 60:
-            recommendation = "BUY"
-            message = "Good conditions, consider buying"
-            message_th = "สภาวะค่อนข้างดี พิจารณาเข้าซื้อได้"
-        elif final_score >= 45:
-            recommendation = "HOLD"
-            message = "Normal conditions, wait for better opportunity"
-            message_th = "สภาวะปกติ รอจังหวะที่ดีกว่า"
-        elif final_score >= 30:
-            recommendation = "CAUTIOUS"
-            message = "Caution! Market has risks"
-            message_th = "ระวัง! ตลาดมีความเสี่ยง"
-        else:
-            recommendation = "AVOID"
-            message = "Avoid buying, high risk"
-            message_th = "หลีกเลี่ยงการซื้อ ความเสี่ยงสูง"
+        recommendation, message, message_th = RECOMMENDATIONS[
+            bisect.bisect_right(RECOMMENDATION_THRESHOLDS, final_score)
+        ]
         
         # Add confidence qualifier
-        if confidence["level"] == "low" or confidence["level"] == "very_low":
-            message += " (Low confidence - limited data)"
-            message_th += " (ความเชื่อมั่นต่ำ - ข้อมูลจำกัด)"
+        if confidence["level"] in LOW_CONFIDENCE_LEVELS:
+            message += LOW_CONFIDENCE_NOTE
+            message_th += LOW_CONFIDENCE_NOTE_TH
         
-        return {
+        result = {
             "score": final_score,
             "recommendation": recommendation,
             "message": message,
@@ -1716,79 +2306,116 @@ class MarketSentimentAnalyzer:
                 "institutional_flow": inst_flow
             },
             "score_breakdown": {
-                "fear_greed": {"score": scores[0], "weight": "18%"},
-                "vix": {"score": scores[1], "weight": "12%"},
-                "breadth": {"score": scores[2], "weight": "12%"},
-                "pcr": {"score": scores[3], "weight": "10%"},
-                "sectors": {"score": scores[4], "weight": "8%"},
-                "ma": {"score": scores[5], "weight": "12%"},
-                "yields": {"score": scores[6], "weight": "5%"},
-                "momentum": {"score": scores[7], "weight": "10%"},
-                "dxy": {"score": scores[8], "weight": "4%"},
-                "institutional": {"score": scores[9], "weight": "5%"},
-                "internals": {"score": scores[10], "weight": "4%"}
+                name: {"score": score, "weight": f"{weight:.0f}%"}
+                for name, score, weight in zip(SCORE_COMPONENTS, scores, SCORE_WEIGHTS)
             },
             "version": "3.0",
-            "updated_at": datetime.now().isoformat()
+            "updated_at": updated_at
         }
+        
+        # Cached as a read-only view of its own top-level dict; every caller gets
+        # a shallow copy. Nested dicts (indicators etc.) are shared with the
+        # caches and must be treated as read-only - copy before mutating.
+        self._set_score_cache(MappingProxyType(dict(result)), list(self.confidence_factors), version)
+        log.info("  ✓ Sentiment refresh done in %.2fs", time.perf_counter() - started)
+        return result
 
-    def analyze(self) -> Dict:
-        """Main analysis function"""
-        result = self.calculate_ai_score()
-        return json.loads(json.dumps(result, default=str))
+    def analyze(self, raw: bool = False) -> Dict:
+        """Main analysis function
+
+        With raw=True the result is returned as computed (numpy scalars and
+        all) for callers that serialize it themselves, e.g. via _json_dumps.
+        Its nested dicts are shared with the cache - copy them before mutating.
+        The default result is converted by _to_native into fresh containers.
+        """
+        result = self.calculate_ai_score(now=datetime.now())
+        return result if raw else _to_native(result)
 
 
 # ==================== Main ====================
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"), format="%(message)s")
     analyzer = MarketSentimentAnalyzer()
-    result = analyzer.analyze()
+    output_path = 'data/market_sentiment.json'
+    
+    # Re-runs within the score TTL reuse the last saved result (--force to refresh)
+    reused = False
+    if '--force' not in sys.argv:
+        try:
+            with open(output_path, 'rb') as f:
+                saved = _json_loads(f.read())
+            # Age from the report's own timestamp - a checkout or pull gives the
+            # tracked file a fresh mtime
+            age = datetime.now() - datetime.fromisoformat(saved['updated_at'])
+            if timedelta(0) <= age < timedelta(seconds=analyzer.score_cache_duration):
+                result = saved
+                reused = True
+                log.info("♻️ Reusing %s (use --force to refresh)", output_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
     
-    print(f"\n{'=' * 60}")
-    print(f"🤖 AI MARKET SCORE: {result['score']}/100")
-    print(f"📊 Recommendation: {result['recommendation']}")
-    print(f"🎯 Confidence: {result['confidence']['level'].upper()} ({result['confidence']['score']}%)")
-    print(f"💬 {result['message']}")
-    print(f"💬 {result['message_th']}")
-    print(f"{'=' * 60}")
+    if not reused:
+        result = analyzer.analyze(raw=True)  # Written with _json_dumps below
     
     # Print indicators
     indicators = result.get("indicators", {})
     
-    print(f"\n📈 VIX: {indicators.get('vix', {}).get('value', 'N/A')} ({indicators.get('vix', {}).get('signal', 'N/A')})")
-    print(f"😱 Fear & Greed (Stock): {indicators.get('fear_greed', {}).get('score', 'N/A')} ({indicators.get('fear_greed', {}).get('source', 'N/A')})")
-    print(f"🪙 Fear & Greed (Crypto): {indicators.get('fear_greed', {}).get('crypto', {}).get('score', 'N/A')}")
-    print(f"📊 Market Breadth: {indicators.get('market_breadth', {}).get('signal', 'N/A')} ({indicators.get('market_breadth', {}).get('source', 'N/A')})")
-    print(f"📞 Put/Call Ratio: {indicators.get('put_call_ratio', {}).get('ratio', 'N/A')} ({indicators.get('put_call_ratio', {}).get('source', 'N/A')})")
-    print(f"🏭 Sector Rotation: {indicators.get('sectors', {}).get('rotation', 'N/A')}")
-    print(f"📉 MA Trend ({indicators.get('moving_averages', {}).get('ma_type', 'EMA')}): {indicators.get('moving_averages', {}).get('trend', 'N/A')}")
-    print(f"📈 Yield Curve: {'Inverted ⚠️' if indicators.get('treasury_yields', {}).get('inverted') else 'Normal'}")
-    print(f"🚀 Momentum: {indicators.get('momentum', {}).get('momentum', 'N/A')}")
-    print(f"💵 Dollar Index: {indicators.get('dollar_index', {}).get('value', 'N/A')}")
-    print(f"🥇 Gold: {indicators.get('gold', {}).get('signal', 'N/A')}")
-    print(f"🏦 Institutional Flow: {indicators.get('institutional_flow', {}).get('signal', 'N/A')}")
-    print(f"📊 Market Internals: {indicators.get('market_internals', {}).get('combined_signal', 'N/A')}")
+    # One lookup per indicator (missing or None indicators print as N/A)
+    vix, fg, breadth, pcr, sectors, ma, yields, momentum, dxy, gold, inst, internals = (
+        indicators.get(name) or {} for name in (
+            'vix', 'fear_greed', 'market_breadth', 'put_call_ratio', 'sectors', 'moving_averages',
+            'treasury_yields', 'momentum', 'dollar_index', 'gold', 'institutional_flow', 'market_internals'
+        )
+    )
+    crypto = fg.get('crypto') or {}
+    
+    # Build the whole report and write it in one go
+    report = [
+        f"\n{'=' * 60}",
+        f"🤖 AI MARKET SCORE: {result['score']}/100",
+        f"📊 Recommendation: {result['recommendation']}",
+        f"🎯 Confidence: {result['confidence']['level'].upper()} ({result['confidence']['score']}%)",
+        f"💬 {result['message']}",
+        f"💬 {result['message_th']}",
+        f"{'=' * 60}",
+        f"\n📈 VIX: {vix.get('value', 'N/A')} ({vix.get('signal', 'N/A')})",
+        f"😱 Fear & Greed (Stock): {fg.get('score', 'N/A')} ({fg.get('source', 'N/A')})",
+        f"🪙 Fear & Greed (Crypto): {crypto.get('score', 'N/A')}",
+        f"📊 Market Breadth: {breadth.get('signal', 'N/A')} ({breadth.get('source', 'N/A')})",
+        f"📞 Put/Call Ratio: {pcr.get('ratio', 'N/A')} ({pcr.get('source', 'N/A')})",
+        f"🏭 Sector Rotation: {sectors.get('rotation', 'N/A')}",
+        f"📉 MA Trend ({ma.get('ma_type', 'EMA')}): {ma.get('trend', 'N/A')}",
+        f"📈 Yield Curve: {'Inverted ⚠️' if yields.get('inverted') else 'Normal'}",
+        f"🚀 Momentum: {momentum.get('momentum', 'N/A')}",
+        f"💵 Dollar Index: {dxy.get('value', 'N/A')}",
+        f"🥇 Gold: {gold.get('signal', 'N/A')}",
+        f"🏦 Institutional Flow: {inst.get('signal', 'N/A')}",
+        f"📊 Market Internals: {internals.get('combined_signal', 'N/A')}",
+    ]
     
     # Economic Calendar
-    calendar = indicators.get('economic_calendar', {})
+    calendar = indicators.get('economic_calendar') or {}
     if calendar.get('upcoming_events'):
-        print(f"\n📅 Upcoming Economic Events:")
-        for event in calendar['upcoming_events'][:3]:
-            print(f"   • {event['event']} - {event['date']} ({event['days_until']} days)")
+        report.append("\n📅 Upcoming Economic Events:")
+        report.extend(
+            f"   • {event['event']} - {event['date']} ({event['days_until']} days)"
+            for event in calendar['upcoming_events'][:3]
+        )
     
     # Score breakdown
-    print(f"\n📊 Score Breakdown:")
-    breakdown = result.get("score_breakdown", {})
-    for key, data in breakdown.items():
-        print(f"   • {key}: {data['score']} (weight: {data['weight']})")
-    
-    # Save to file
-    os.makedirs('data', exist_ok=True)
-    with open('data/market_sentiment.json', 'w') as f:
-        json.dump(result, f, indent=2)
-    print("\n✅ Saved to data/market_sentiment.json")
+    report.append("\n📊 Score Breakdown:")
+    report.extend(
+        f"   • {key}: {data['score']} (weight: {data['weight']})"
+        for key, data in result.get("score_breakdown", {}).items()
+    )
+    print("\n".join(report))
     
-    # Also save to backend/data for GitHub Actions
-    os.makedirs('backend/data', exist_ok=True)
-    with open('backend/data/market_sentiment.json', 'w') as f:
-        json.dump(result, f, indent=2)
-    print("✅ Saved to backend/data/market_sentiment.json")
+    if not reused:
+        # Save to file (compact unless SENTIMENT_PRETTY is set)
+        payload = _json_dumps(result, indent=bool(os.environ.get('SENTIMENT_PRETTY')))
+        _write_atomic(output_path, payload)
+        print(f"\n✅ Saved to {output_path}")
+        
+        # Also save to backend/data for GitHub Actions
+        _write_atomic('backend/data/market_sentiment.json', payload)
+        print("✅ Saved to backend/data/market_sentiment.json")
@@ -13,6 +13,7 @@ Outputs to both backend/data/ and public/data/ for Next.js
 import os
 import json
 import shutil
+import logging
 from datetime import datetime
 from typing import Dict, List
 
@@ -383,4 +384,5 @@ def generate_position_summary(stocks: Dict) -> Dict:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"), format="%(message)s")
     analyze_all()